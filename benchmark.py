@@ -0,0 +1,103 @@
+"""Benchmark decoding streaming values with auto_type and the decoder table.
+
+Usage: python benchmark.py [messages.jsonl]
+
+The optional file holds one recorded stream message per line, otherwise a
+sample of typical fields is used.
+"""
+
+import json
+import sys
+from timeit import timeit
+
+from custom_components.teslemetry.binary_sensor import (
+    VEHICLE_DESCRIPTIONS as BINARY_VEHICLE_DESCRIPTIONS,
+    VEHICLE_STREAM_DESCRIPTIONS as BINARY_VEHICLE_STREAM_DESCRIPTIONS,
+)
+from custom_components.teslemetry.helpers import auto_type
+from custom_components.teslemetry.sensor import (
+    VEHICLE_DESCRIPTIONS as SENSOR_VEHICLE_DESCRIPTIONS,
+    VEHICLE_STREAM_DESCRIPTIONS as SENSOR_VEHICLE_STREAM_DESCRIPTIONS,
+)
+
+SAMPLE = [
+    {
+        "data": {
+            "BatteryLevel": "78.52",
+            "VehicleSpeed": "64",
+            "Odometer": "18234.6",
+            "PackVoltage": "398.21",
+            "PackCurrent": "-12.5",
+            "ChargeState": "Idle",
+            "Gear": "D",
+            "BrakePedal": "false",
+            "ChargerPhases": "3",
+            "InsideTemp": "21.5",
+            "OutsideTemp": "14",
+            "DestinationLocation": {"latitude": -33.86, "longitude": 151.21},
+        }
+    },
+    {
+        "data": {
+            "VehicleSpeed": "71",
+            "PackVoltage": "397.98",
+            "PackCurrent": "-48.25",
+            "BrakePedal": "true",
+            "Gear": "D",
+        }
+    },
+]
+
+
+def build_table() -> dict:
+    """Return the distinct decoders of each field, as the dispatcher groups them."""
+    table: dict = {}
+    for description in (*SENSOR_VEHICLE_DESCRIPTIONS, *BINARY_VEHICLE_DESCRIPTIONS):
+        if description.streaming_key:
+            table.setdefault(description.streaming_key, set()).add(
+                description.streaming_decoder
+            )
+    for description in (
+        *SENSOR_VEHICLE_STREAM_DESCRIPTIONS,
+        *BINARY_VEHICLE_STREAM_DESCRIPTIONS,
+    ):
+        table.setdefault(description.key, set()).add(description.streaming_decoder)
+    return table
+
+
+def main() -> None:
+    """Time both approaches over the message mix."""
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf8") as file:
+            messages = [json.loads(line) for line in file if line.strip()]
+    else:
+        messages = SAMPLE
+    values = [
+        (field, value)
+        for message in messages
+        for field, value in message.get("data", {}).items()
+    ]
+    table = build_table()
+
+    def old() -> None:
+        for _, value in values:
+            if isinstance(value, str):
+                auto_type(value)
+
+    def new() -> None:
+        for field, value in values:
+            for decoder in table.get(field, ()):
+                decoder(value)
+
+    number = 20000
+    old_time = timeit(old, number=number)
+    new_time = timeit(new, number=number)
+    per_value = 1e9 / (number * len(values))
+    print(f"{len(values)} values, {len(table)} fields")  # noqa: T201
+    print(f"auto_type      {old_time * per_value:8.1f} ns/value")  # noqa: T201
+    print(f"decoder table  {new_time * per_value:8.1f} ns/value")  # noqa: T201
+    print(f"speedup        {old_time / new_time:8.2f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 """Teslemetry integration."""
 
 import asyncio
-from typing import Final
+from collections.abc import Awaitable, Mapping
+from datetime import timedelta
+from time import monotonic
+from typing import Any, Final, TypeVar
 
 from tesla_fleet_api import EnergySpecific, Teslemetry, VehicleSpecific
 from tesla_fleet_api.const import Scope
@@ -11,26 +14,51 @@ from tesla_fleet_api.exceptions import (
     TeslaFleetError,
     Forbidden,
 )
-from tesla_fleet_api.teslemetry import rate_limit
 from teslemetry_stream import TeslemetryStream, TeslemetryStreamVehicleNotConfigured
 
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ACCESS_TOKEN, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, LOGGER, MODELS
+from .const import (
+    CONF_ENERGYSITES,
+    CONF_INFO_INTERVAL,
+    CONF_LIVE_INTERVAL,
+    CONF_POLL_INTERVAL,
+    CONF_SLEEP_WAIT,
+    CONF_STREAM_FILTERS,
+    CONF_STREAMING_GAP,
+    CONF_VEHICLES,
+    CONF_WRITE_INTERVAL,
+    DEFAULT_WRITE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    MODELS,
+    STREAMING_GAP,
+    TeslemetryPriority,
+)
 from .coordinator import (
+    ENERGY_INFO_INTERVAL,
+    ENERGY_LIVE_INTERVAL,
+    VEHICLE_INTERVAL,
+    VEHICLE_WAIT,
     TeslemetryEnergySiteInfoCoordinator,
     TeslemetryEnergySiteLiveCoordinator,
     TeslemetryVehicleDataCoordinator,
 )
+from .helpers import TeslemetryCommandQueue, TeslemetryWakeUpManager
 from .models import TeslemetryData, TeslemetryEnergyData, TeslemetryVehicleData
+from .scheduler import TeslemetryScheduler
 from .services import async_register_services
+from .session import async_create_session
+from .snapshot import TeslemetrySnapshot
+from .stream import TeslemetryStreamDispatcher
+
+_T = TypeVar("_T")
 
 PLATFORMS: Final = [
     Platform.BINARY_SENSOR,
@@ -58,7 +86,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Teslemetry config."""
 
     access_token = entry.data[CONF_ACCESS_TOKEN]
-    session = async_get_clientsession(hass)
+    scheduler = TeslemetryScheduler(hass)
+    session = async_create_session(hass, entry, [scheduler.trace_config])
+    timings: dict[str, float] = {}
+    snapshot = TeslemetrySnapshot(hass, entry.entry_id)
 
     # Create API connection
     teslemetry = Teslemetry(
@@ -67,8 +98,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     try:
         calls = await asyncio.gather(
-            teslemetry.metadata(),
-            teslemetry.products(),
+            async_timed(
+                timings,
+                "metadata",
+                scheduler.async_call(TeslemetryPriority.POLL, teslemetry.metadata()),
+            ),
+            async_timed(
+                timings,
+                "products",
+                scheduler.async_call(TeslemetryPriority.POLL, teslemetry.products()),
+            ),
+            async_timed(timings, "snapshot", snapshot.async_load()),
         )
         uid = calls[0]["uid"]
         scopes = calls[0]["scopes"]
@@ -94,10 +134,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             product.pop("cached_data", None)
             vin = product["vin"]
             api = VehicleSpecific(teslemetry.vehicle, vin)
-            coordinator = TeslemetryVehicleDataCoordinator(hass, api, product)
             stream = TeslemetryStream(
                 session, access_token, vin=vin, parse_timestamp=True
             )
+            dispatcher = TeslemetryStreamDispatcher(stream, vin)
+            coordinator = TeslemetryVehicleDataCoordinator(
+                hass, api, product, dispatcher, scheduler
+            )
+            if vehicle_snapshot := snapshot.vehicle(vin):
+                coordinator.async_hydrate(vehicle_snapshot["data"], snapshot.saved_at)
+                if (config := vehicle_snapshot["stream"])["hostname"]:
+                    # Subscribe straight away, the config is refreshed later
+                    stream.server = config["hostname"]
+                    stream.fields = config["fields"]
+                    stream.alerts = config["alerts"]
+            wakeup = TeslemetryWakeUpManager(hass, api, coordinator)
             device = DeviceInfo(
                 identifiers={(DOMAIN, vin)},
                 manufacturer="Tesla",
@@ -112,16 +163,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     api=api,
                     coordinator=coordinator,
                     stream=stream,
+                    dispatcher=dispatcher,
                     vin=vin,
                     device=device,
+                    wakeup=wakeup,
+                    commands=TeslemetryCommandQueue(hass, wakeup),
                     remove_listeners=(),
                 )
             )
         elif "energy_site_id" in product and Scope.ENERGY_DEVICE_DATA in scopes:
             site_id = product["energy_site_id"]
             api = EnergySpecific(teslemetry.energy, site_id)
-            live_coordinator = TeslemetryEnergySiteLiveCoordinator(hass, api, entry.entry_id)
-            info_coordinator = TeslemetryEnergySiteInfoCoordinator(hass, api, entry.entry_id, product)
+            live_coordinator = TeslemetryEnergySiteLiveCoordinator(hass, api, entry.entry_id, scheduler)
+            info_coordinator = TeslemetryEnergySiteInfoCoordinator(hass, api, entry.entry_id, product, scheduler)
+            if site_snapshot := snapshot.energysite(site_id):
+                live_coordinator.data = site_snapshot["live"]
+                info_coordinator.data = site_snapshot["info"]
 
             device = DeviceInfo(
                 identifiers={(DOMAIN, str(site_id))},
@@ -140,23 +197,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 )
             )
 
-    # Run all coordinator first refreshes
-    await asyncio.gather(
-        *(async_setup_stream(hass, vehicle) for vehicle in vehicles),
-        *(
-            vehicle.coordinator.async_config_entry_first_refresh()
-            for vehicle in vehicles
-        ),
-        *(
-            energysite.live_coordinator.async_config_entry_first_refresh()
-            for energysite in energysites
-        ),
-        *(
-            energysite.info_coordinator.async_config_entry_first_refresh()
-            for energysite in energysites
+    async_apply_options(entry.options, vehicles, energysites)
+
+    # Vehicle entities start from the products payload, so their stream
+    # config and first refresh can finish in the background
+    for vehicle in vehicles:
+        entry.async_create_background_task(
+            hass, async_setup_vehicle(hass, vehicle), f"Teslemetry {vehicle.vin}"
+        )
+
+    # Energy site entities depend on their data, so refresh them first
+    # unless the snapshot already has it
+    hydrated = [x for x in energysites if snapshot.energysite(x.id)]
+    for energysite in hydrated:
+        for coordinator in (energysite.live_coordinator, energysite.info_coordinator):
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"Teslemetry {coordinator.name}"
+            )
+    await async_timed(
+        timings,
+        "energy first refresh",
+        asyncio.gather(
+            *(
+                coordinator.async_config_entry_first_refresh()
+                for energysite in energysites
+                if energysite not in hydrated
+                for coordinator in (
+                    energysite.live_coordinator,
+                    energysite.info_coordinator,
+                )
+            ),
         ),
     )
 
+    # Save the latest data of every coordinator for the next startup
+    snapshot.vehicles = vehicles
+    snapshot.energysites = energysites
+    for coordinator in (
+        *(vehicle.coordinator for vehicle in vehicles),
+        *(energysite.live_coordinator for energysite in energysites),
+        *(energysite.info_coordinator for energysite in energysites),
+    ):
+        entry.async_on_unload(
+            coordinator.async_add_listener(snapshot.async_schedule_save)
+        )
+
     # Enrich devices
     for energysite in energysites:
         models = set()
@@ -171,61 +256,154 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Setup Platforms
     entry.runtime_data = TeslemetryData(
-        vehicles, energysites, scopes
+        vehicles, energysites, scopes, snapshot, session, scheduler
+    )
+    await async_timed(
+        timings,
+        "platform setup",
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+    )
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    LOGGER.debug(
+        "Teslemetry setup took %s",
+        ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items()),
     )
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 
+async def async_timed(
+    timings: dict[str, float], phase: str, target: Awaitable[_T]
+) -> _T:
+    """Await a startup phase and record how long it took."""
+    start = monotonic()
+    try:
+        return await target
+    finally:
+        timings[phase] = monotonic() - start
+
+
+async def async_setup_vehicle(
+    hass: HomeAssistant, vehicle: TeslemetryVehicleData
+) -> None:
+    """Set up the stream and first refresh of a vehicle in the background."""
+    timings: dict[str, float] = {}
+    await asyncio.gather(
+        async_timed(timings, "stream config", async_setup_stream(hass, vehicle)),
+        async_timed(timings, "first refresh", vehicle.coordinator.async_refresh()),
+    )
+    LOGGER.debug(
+        "Vehicle %s setup took %s",
+        vehicle.vin,
+        ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items()),
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Teslemetry Config."""
     for vehicle in entry.runtime_data.vehicles:
         for remove_listener in vehicle.remove_listeners:
             remove_listener()
+        vehicle.dispatcher.async_unsubscribe()
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        await entry.runtime_data.snapshot.async_save()
         del entry.runtime_data
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the snapshot of a removed config entry."""
+    await TeslemetrySnapshot(hass, entry.entry_id).async_remove()
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply the options to the running vehicles and energy sites."""
+    async_apply_options(
+        entry.options, entry.runtime_data.vehicles, entry.runtime_data.energysites
+    )
+
+
+@callback
+def async_apply_options(
+    options: Mapping[str, Any],
+    vehicles: list[TeslemetryVehicleData],
+    energysites: list[TeslemetryEnergyData],
+) -> None:
+    """Apply the entry options and the overrides of each vehicle and site.
+
+    Intervals are given in seconds. Coordinators reschedule their next
+    refresh, and entities read the new settings on their next update.
+    """
+    for vehicle in vehicles:
+        settings = options.get(CONF_VEHICLES, {}).get(vehicle.vin, {})
+        vehicle.write_interval = settings.get(
+            CONF_WRITE_INTERVAL,
+            options.get(CONF_WRITE_INTERVAL, DEFAULT_WRITE_INTERVAL),
+        )
+        vehicle.stream_filters = {
+            **options.get(CONF_STREAM_FILTERS, {}),
+            **settings.get(CONF_STREAM_FILTERS, {}),
+        }
+        vehicle.coordinator.async_configure(
+            interval=_interval(settings, CONF_POLL_INTERVAL, VEHICLE_INTERVAL),
+            wait=_interval(settings, CONF_SLEEP_WAIT, VEHICLE_WAIT),
+            streaming_gap=int(
+                settings.get(CONF_STREAMING_GAP, STREAMING_GAP / 1000) * 1000
+            ),
+        )
+    for energysite in energysites:
+        settings = options.get(CONF_ENERGYSITES, {}).get(str(energysite.id), {})
+        energysite.live_coordinator.async_set_update_interval(
+            _interval(settings, CONF_LIVE_INTERVAL, ENERGY_LIVE_INTERVAL)
+        )
+        energysite.info_coordinator.async_set_update_interval(
+            _interval(settings, CONF_INFO_INTERVAL, ENERGY_INFO_INTERVAL)
+        )
+
+
+def _interval(settings: Mapping[str, Any], key: str, default: timedelta) -> timedelta:
+    """Return an interval option in seconds, or its default."""
+    if key in settings:
+        return timedelta(seconds=settings[key])
+    return default
+
+
 async def async_setup_stream(hass: HomeAssistant, vehicle: TeslemetryVehicleData):
     """Setup stream for vehicle."""
     LOGGER.debug("Stream Starting Up")
     try:
-        async with rate_limit:
-            await vehicle.stream.get_config()
-
-            def handle_alerts(event: dict):
-                """Handle stream alerts."""
-                if alerts := event.get("alerts"):
-                    for alert in alerts:
-                        if alert["startedAt"] <= vehicle.last_alert:
-                            break
-                        alert["vin"] = vehicle.vin
-                        hass.bus.fire("teslemetry_alert", alert)
-                    vehicle.last_alert = alerts[0]["startedAt"]
-
-            def handle_errors(event: dict):
-                """Handle stream errors."""
-                if errors := event.get("errors"):
-                    for error in errors:
-                        if error["startedAt"] <= vehicle.last_error:
-                            break
-                        error["vin"] = vehicle.vin
-                        hass.bus.fire("teslemetry_error", error)
-                    vehicle.last_error = errors[0]["startedAt"]
-
-            vehicle.remove_listeners = (
-                vehicle.stream.async_add_listener(
-                    handle_alerts,
-                    {"vin": vehicle.vin, "alerts": None},
-                ),
-                vehicle.stream.async_add_listener(
-                    handle_errors,
-                    {"vin": vehicle.vin, "errors": None},
-                ),
-            )
+        await vehicle.coordinator.scheduler.async_call(
+            TeslemetryPriority.INFO, vehicle.stream.get_config()
+        )
+
+        def handle_alerts(event: dict):
+            """Handle stream alerts."""
+            if alerts := event.get("alerts"):
+                for alert in alerts:
+                    if alert["startedAt"] <= vehicle.last_alert:
+                        break
+                    alert["vin"] = vehicle.vin
+                    hass.bus.fire("teslemetry_alert", alert)
+                vehicle.last_alert = alerts[0]["startedAt"]
+
+        def handle_errors(event: dict):
+            """Handle stream errors."""
+            if errors := event.get("errors"):
+                for error in errors:
+                    if error["startedAt"] <= vehicle.last_error:
+                        break
+                    error["vin"] = vehicle.vin
+                    hass.bus.fire("teslemetry_error", error)
+                vehicle.last_error = errors[0]["startedAt"]
+
+        vehicle.remove_listeners = (
+            vehicle.dispatcher.async_add_event_listener("alerts", handle_alerts),
+            vehicle.dispatcher.async_add_event_listener("errors", handle_errors),
+        )
     except TeslemetryStreamVehicleNotConfigured:
+        # Forget a server that was restored from the snapshot
+        vehicle.stream.server = None
+        vehicle.dispatcher.async_unsubscribe()
         LOGGER.warning(
             "Vehicle %s is not configured for streaming. Configure at https://teslemetry.com/console/%s",
             vehicle.vin,
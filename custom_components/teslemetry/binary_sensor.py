@@ -5,10 +5,12 @@ from __future__ import annotations
 from itertools import chain
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from tesla_fleet_api.const import TelemetryField
 
 from homeassistant.components.binary_sensor import (
+    DOMAIN as BINARY_SENSOR_DOMAIN,
     BinarySensorDeviceClass,
     BinarySensorEntity,
     BinarySensorEntityDescription,
@@ -27,7 +29,8 @@ from .entity import (
     TeslemetryVehicleStreamEntity,
 )
 from .models import TeslemetryVehicleData, TeslemetryEnergyData
-from .helpers import auto_type
+from .filters import TeslemetryFilter, apply_filters, copy_filters
+from .helpers import async_disabled_unique_ids, decode_auto, decode_bool, decode_int
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -37,6 +40,8 @@ class TeslemetryBinarySensorEntityDescription(BinarySensorEntityDescription):
     is_on: Callable[[StateType], bool] = lambda x: bool(x)
     timestamp_key: TeslemetryTimestamp | None = None
     streaming_key: TelemetryField | None = None
+    streaming_decoder: Callable[[Any], Any] = decode_auto
+    filters: tuple[TeslemetryFilter, ...] = ()
 
 
 VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
@@ -48,6 +53,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
     TeslemetryBinarySensorEntityDescription(
         key="charge_state_battery_heater_on",
         streaming_key=TelemetryField.BATTERY_HEATER_ON,
+        streaming_decoder=decode_bool,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         device_class=BinarySensorDeviceClass.HEAT,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -56,6 +62,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
     TeslemetryBinarySensorEntityDescription(
         key="charge_state_charger_phases",
         streaming_key=TelemetryField.CHARGER_PHASES,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         is_on=lambda x: int(x) > 1,
         entity_registry_enabled_default=False,
@@ -63,6 +70,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
     TeslemetryBinarySensorEntityDescription(
         key="charge_state_preconditioning_enabled",
         streaming_key=TelemetryField.PRECONDITIONING_ENABLED,
+        streaming_decoder=decode_bool,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
@@ -76,6 +84,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
     TeslemetryBinarySensorEntityDescription(
         key="charge_state_scheduled_charging_pending",
         streaming_key=TelemetryField.SCHEDULED_CHARGING_PENDING,
+        streaming_decoder=decode_bool,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
@@ -199,7 +208,8 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetryBinarySensorEntityDescription, ...] = (
 class TeslemetryStreamBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes Teslemetry binary sensor entity."""
 
-    is_on: Callable[[StateType], bool] = lambda x: x.lower() == "true"
+    is_on: Callable[[StateType], bool] = lambda x: x is True
+    streaming_decoder: Callable[[Any], Any] = decode_bool
 
 
 VEHICLE_STREAM_DESCRIPTIONS: tuple[
@@ -257,6 +267,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry binary sensor platform from a config entry."""
 
+    disabled = async_disabled_unique_ids(hass, entry, BINARY_SENSOR_DOMAIN)
 
     async_add_entities(
         chain(
@@ -264,6 +275,7 @@ async def async_setup_entry(
                 TeslemetryVehicleBinarySensorEntity(vehicle, description)
                 for vehicle in entry.runtime_data.vehicles
                 for description in VEHICLE_DESCRIPTIONS
+                if f"{vehicle.vin}-{description.key}" not in disabled
             ),
             (  # Energy Site Live
                 TeslemetryEnergyLiveBinarySensorEntity(energysite, description)
@@ -285,6 +297,7 @@ class TeslemetryVehicleBinarySensorEntity(TeslemetryVehicleEntity, BinarySensorE
     """Base class for Teslemetry vehicle binary sensors."""
 
     entity_description: TeslemetryBinarySensorEntityDescription
+    _filters: tuple[TeslemetryFilter, ...] = ()
 
     def __init__(
         self,
@@ -293,6 +306,8 @@ class TeslemetryVehicleBinarySensorEntity(TeslemetryVehicleEntity, BinarySensorE
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description
+        if description.filters:
+            self._filters = copy_filters(description.filters)
         super().__init__(
             data, description.key, description.timestamp_key, description.streaming_key
         )
@@ -300,20 +315,29 @@ class TeslemetryVehicleBinarySensorEntity(TeslemetryVehicleEntity, BinarySensorE
     def _async_update_attrs(self) -> None:
         """Update the attributes of the binary sensor."""
 
-        if self.coordinator.updated_once:
+        if self.coordinator.has_data:
             if self._value is None:
                 self._attr_available = False
                 self._attr_is_on = None
             else:
                 self._attr_available = True
-                self._attr_is_on = self.entity_description.is_on(self._value)
+                self._attr_is_on = self.entity_description.is_on(
+                    apply_filters(self._filters, self._value)
+                )
         else:
             self._attr_is_on = None
 
+    @property
+    def streaming_decoder(self) -> Callable[[Any], Any]:
+        """Return the decoder of the streaming key."""
+        return self.entity_description.streaming_decoder
+
     def _async_value_from_stream(self, value) -> None:
         """Update the value from the stream."""
         self._attr_available = True
-        self._attr_is_on = self.entity_description.is_on(auto_type(value))
+        self._attr_is_on = self.entity_description.is_on(
+            apply_filters(self._filters, value)
+        )
 
 
 class TeslemetryStreamBinarySensorEntity(
@@ -321,20 +345,25 @@ class TeslemetryStreamBinarySensorEntity(
 ):
     """Base class for Teslemetry vehicle streaming sensors."""
 
-    entity_description: BinarySensorEntityDescription
+    entity_description: TeslemetryStreamBinarySensorEntityDescription
 
     def __init__(
         self,
         data: TeslemetryVehicleData,
-        description: BinarySensorEntityDescription,
+        description: TeslemetryStreamBinarySensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description
         super().__init__(data, description.key)
 
+    @property
+    def streaming_decoder(self) -> Callable[[Any], Any]:
+        """Return the decoder of the streaming key."""
+        return self.entity_description.streaming_decoder
+
     def _async_value_from_stream(self, value) -> None:
         """Update the value of the entity."""
-        self._attr_native_value = self.entity_description.value_fn(value)
+        self._attr_is_on = self.entity_description.is_on(value)
 
 
 class TeslemetryEnergyLiveBinarySensorEntity(
@@ -89,9 +89,10 @@ class TeslemetryButtonEntity(TeslemetryVehicleEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Press the button."""
-        await self.wake_up_if_asleep()
         if self.entity_description.func:
             await self.handle_command(self.entity_description.func(self))
+        else:
+            await self.wake_up_if_asleep()
 
 
 class TeslemetryRefreshButtonEntity(TeslemetryVehicleEntity, ButtonEntity):
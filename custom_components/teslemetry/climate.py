@@ -24,6 +24,7 @@ from homeassistant.exceptions import ServiceValidationError
 
 from .const import DOMAIN, TeslemetryClimateSide, TeslemetryTimestamp
 from .entity import TeslemetryVehicleEntity
+from .helpers import decode_float
 from .models import TeslemetryVehicleData
 
 DEFAULT_MIN_TEMP = 15
@@ -55,6 +56,18 @@ async def async_setup_entry(
 class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
     """Vehicle Climate Control."""
 
+    streaming_decoder = staticmethod(decode_float)
+    coordinator_keys = (
+        "climate_state_is_climate_on",
+        "climate_state_inside_temp",
+        "climate_state_climate_keeper_mode",
+        "climate_state_bioweapon_mode",
+        "climate_state_min_avail_temp",
+        "climate_state_max_avail_temp",
+    )
+    # The stream only reports the inside temperature
+    _stream_confirms_commands = False
+
     _attr_precision = PRECISION_HALVES
 
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -80,6 +93,10 @@ class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
         self.scoped = Scope.VEHICLE_CMDS in scopes
         if not self.scoped:
             self._attr_supported_features = ClimateEntityFeature(0)
+        self.coordinator_keys = (
+            *self.coordinator_keys,
+            f"climate_state_{side}_setting",
+        )
 
         super().__init__(
             data,
@@ -119,8 +136,11 @@ class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
     async def async_turn_on(self) -> None:
         """Set the climate state to on."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.auto_conditioning_start())
+        await self.handle_command(
+            self.api.auto_conditioning_start(),
+            self._attr_hvac_mode,
+            HVACMode.HEAT_COOL,
+        )
 
         self._attr_hvac_mode = HVACMode.HEAT_COOL
         self.async_write_ha_state()
@@ -128,8 +148,9 @@ class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
     async def async_turn_off(self) -> None:
         """Set the climate state to off."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.auto_conditioning_stop())
+        await self.handle_command(
+            self.api.auto_conditioning_stop(), self._attr_hvac_mode, HVACMode.OFF
+        )
 
         self._attr_hvac_mode = HVACMode.OFF
         self._attr_preset_mode = self._attr_preset_modes[0]
@@ -141,12 +162,13 @@ class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
 
         if temp := kwargs[ATTR_TEMPERATURE]:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
             await self.handle_command(
                 self.api.set_temps(
                     driver_temp=temp,
                     passenger_temp=temp,
-                )
+                ),
+                self._attr_target_temperature,
+                temp,
             )
             self._attr_target_temperature = temp
 
@@ -166,11 +188,12 @@ class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the climate preset mode."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         await self.handle_command(
             self.api.set_climate_keeper_mode(
                 climate_keeper_mode=self._attr_preset_modes.index(preset_mode)
-            )
+            ),
+            self._attr_preset_mode,
+            preset_mode,
         )
         self._attr_preset_mode = preset_mode
         if preset_mode == self._attr_preset_modes[0]:
@@ -182,12 +205,13 @@ class TeslemetryClimateEntity(TeslemetryVehicleEntity, ClimateEntity):
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set the Bioweapon defense mode."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         await self.handle_command(
             self.api.set_bioweapon_mode(
                 on=(fan_mode != 'off'),
                 manual_override=True,
-            )
+            ),
+            self._attr_fan_mode,
+            fan_mode,
         )
         self._attr_fan_mode = fan_mode
         if fan_mode == self._attr_fan_modes[1]:
@@ -211,6 +235,15 @@ COP_LEVELS = {
 class TeslemetryCabinOverheatProtectionEntity(TeslemetryVehicleEntity, ClimateEntity):
     """Vehicle Cabin Overheat Protection."""
 
+    streaming_decoder = staticmethod(decode_float)
+    coordinator_keys = (
+        "climate_state_cop_activation_temperature",
+        "climate_state_inside_temp",
+        "vehicle_config_cop_user_set_temp_supported",
+    )
+    # The stream only reports the inside temperature
+    _stream_confirms_commands = False
+
     _attr_precision = PRECISION_WHOLE
     _attr_target_temperature_step = 5
     _attr_min_temp = 30
@@ -227,6 +260,9 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryVehicleEntity, ClimateEn
     ) -> None:
         """Initialize the climate."""
 
+        # Scopes
+        self.scoped = Scope.VEHICLE_CMDS in scopes
+
         super().__init__(
             data,
             "climate_state_cabin_overheat_protection",
@@ -234,20 +270,18 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryVehicleEntity, ClimateEn
             streaming_key=TelemetryField.INSIDE_TEMP,
         )
 
-        # Supported Features
-        self._attr_supported_features = (
-            ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
-        )
-        if self.get("vehicle_config_cop_user_set_temp_supported"):
-            self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
-
-        # Scopes
-        self.scoped = Scope.VEHICLE_CMDS in scopes
+    def _async_update_attrs(self) -> None:
+        """Update the attributes of the entity."""
+        # Supported Features, as the vehicle config may not be loaded yet
         if not self.scoped:
             self._attr_supported_features = ClimateEntityFeature(0)
+        elif self.get("vehicle_config_cop_user_set_temp_supported"):
+            self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+        else:
+            self._attr_supported_features = (
+                ClimateEntityFeature.TURN_ON | ClimateEntityFeature.TURN_OFF
+            )
 
-    def _async_update_attrs(self) -> None:
-        """Update the attributes of the entity."""
         state = self.get("climate_state_cabin_overheat_protection")
         if state is None:
             self._attr_hvac_mode = None
@@ -264,7 +298,7 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryVehicleEntity, ClimateEn
 
     def _async_value_from_stream(self, value) -> None:
         """Update the value from the stream."""
-        self._attr_current_temperature = float(value)
+        self._attr_current_temperature = value
 
     async def async_turn_on(self) -> None:
         """Set the climate state to on."""
@@ -287,8 +321,9 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryVehicleEntity, ClimateEn
             else:
                 raise ServiceValidationError("Invalid temperature")
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.set_cop_temp(cop_mode))
+            await self.handle_command(
+                self.api.set_cop_temp(cop_mode), self._attr_target_temperature, temp
+            )
             self._attr_target_temperature = temp
 
         if mode := kwargs[ATTR_HVAC_MODE]:
@@ -300,18 +335,23 @@ class TeslemetryCabinOverheatProtectionEntity(TeslemetryVehicleEntity, ClimateEn
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the climate mode and state."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         if hvac_mode == HVACMode.OFF:
             await self.handle_command(
-                self.api.set_cabin_overheat_protection(on=False, fan_only=False)
+                self.api.set_cabin_overheat_protection(on=False, fan_only=False),
+                self._attr_hvac_mode,
+                hvac_mode,
             )
         elif hvac_mode == HVACMode.COOL:
             await self.handle_command(
-                self.api.set_cabin_overheat_protection(on=True, fan_only=False)
+                self.api.set_cabin_overheat_protection(on=True, fan_only=False),
+                self._attr_hvac_mode,
+                hvac_mode,
             )
         elif hvac_mode == HVACMode.FAN_ONLY:
             await self.handle_command(
-                self.api.set_cabin_overheat_protection(on=True, fan_only=True)
+                self.api.set_cabin_overheat_protection(on=True, fan_only=True),
+                self._attr_hvac_mode,
+                hvac_mode,
             )
 
         self._attr_hvac_mode = hvac_mode
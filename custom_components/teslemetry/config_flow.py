@@ -16,12 +16,54 @@ from tesla_fleet_api.exceptions import (
 )
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, ConfigFlow, FlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigEntryState,
+    ConfigFlow,
+    FlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_ACCESS_TOKEN
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
-from .const import DOMAIN, LOGGER
-
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_PERCENT,
+    CONF_ENERGYSITE,
+    CONF_ENERGYSITES,
+    CONF_FIELD,
+    CONF_INFO_INTERVAL,
+    CONF_LIVE_INTERVAL,
+    CONF_MAX_RATE,
+    CONF_POLL_INTERVAL,
+    CONF_SLEEP_WAIT,
+    CONF_STREAM_FILTERS,
+    CONF_STREAMING_GAP,
+    CONF_VEHICLE,
+    CONF_VEHICLES,
+    CONF_WRITE_INTERVAL,
+    DEFAULT_WRITE_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    STREAM_FILTER_DEFAULTS,
+    STREAMING_GAP,
+)
+from .coordinator import (
+    ENERGY_INFO_INTERVAL,
+    ENERGY_LIVE_INTERVAL,
+    VEHICLE_INTERVAL,
+    VEHICLE_WAIT,
+)
 TESLEMETRY_SCHEMA = vol.Schema({vol.Required(CONF_ACCESS_TOKEN): str})
 DESCRIPTION_PLACEHOLDERS = {
     "console_url": "teslemetry.com/console",
@@ -36,6 +78,12 @@ class TeslemetryConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
     _entry: ConfigEntry | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return TeslemetryOptionsFlow(config_entry)
+
     async def async_auth(self, user_input: Mapping[str, Any]) -> dict[str, str]:
         """Reusable Auth Helper."""
         access_token = user_input.get(CONF_ACCESS_TOKEN,"").strip()
@@ -110,3 +158,317 @@ class TeslemetryConfigFlow(ConfigFlow, domain=DOMAIN):
             data_schema=TESLEMETRY_SCHEMA,
             errors=errors,
         )
+
+
+class TeslemetryOptionsFlow(OptionsFlow):
+    """Handle Teslemetry options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+        self._vin: str = ""
+        self._site_id: str = ""
+        self._field: str = ""
+
+    def _vehicles(self) -> dict[str, str]:
+        """Return the name of each vehicle by VIN."""
+        if self.config_entry.state is not ConfigEntryState.LOADED:
+            return {}
+        return {
+            vehicle.vin: vehicle.device["name"]
+            for vehicle in self.config_entry.runtime_data.vehicles
+        }
+
+    def _energysites(self) -> dict[str, str]:
+        """Return the name of each energy site by ID."""
+        if self.config_entry.state is not ConfigEntryState.LOADED:
+            return {}
+        return {
+            str(energysite.id): energysite.device["name"]
+            for energysite in self.config_entry.runtime_data.energysites
+        }
+
+    async def async_step_init(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        menu_options = ["settings"]
+        if self._vehicles():
+            menu_options += ["vehicle", "stream_filters"]
+        if self._energysites():
+            menu_options.append("energysite")
+        return self.async_show_menu(step_id="init", menu_options=menu_options)
+
+    async def async_step_settings(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the streaming write interval."""
+        if user_input is not None:
+            return self.async_create_entry(
+                data={**self.config_entry.options, **user_input}
+            )
+
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_WRITE_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_WRITE_INTERVAL, DEFAULT_WRITE_INTERVAL
+                        ),
+                    ): _seconds(0, 60),
+                }
+            ),
+        )
+
+    async def async_step_vehicle(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the vehicle to tune."""
+        if user_input is not None:
+            self._vin = user_input[CONF_VEHICLE]
+            return await self.async_step_vehicle_options()
+
+        return self.async_show_form(
+            step_id="vehicle",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_VEHICLE): _select(self._vehicles())}
+            ),
+        )
+
+    async def async_step_vehicle_options(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Tune the polling and streaming of a vehicle."""
+        options = self.config_entry.options
+        defaults = {
+            CONF_POLL_INTERVAL: VEHICLE_INTERVAL.total_seconds(),
+            CONF_SLEEP_WAIT: VEHICLE_WAIT.total_seconds(),
+            CONF_STREAMING_GAP: STREAMING_GAP / 1000,
+            CONF_WRITE_INTERVAL: options.get(
+                CONF_WRITE_INTERVAL, DEFAULT_WRITE_INTERVAL
+            ),
+        }
+        vehicles = dict(options.get(CONF_VEHICLES, {}))
+        settings = dict(vehicles.get(self._vin, {}))
+
+        if user_input is not None:
+            # Only keep values that differ, so vehicles follow later defaults
+            for key, value in user_input.items():
+                if value == defaults[key]:
+                    settings.pop(key, None)
+                else:
+                    settings[key] = value
+            _store(vehicles, self._vin, settings)
+            return self.async_create_entry(data={**options, CONF_VEHICLES: vehicles})
+
+        current = {key: settings.get(key, value) for key, value in defaults.items()}
+        return self.async_show_form(
+            step_id="vehicle_options",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_POLL_INTERVAL, default=current[CONF_POLL_INTERVAL]
+                    ): _seconds(10, 3600),
+                    vol.Required(
+                        CONF_SLEEP_WAIT, default=current[CONF_SLEEP_WAIT]
+                    ): _seconds(60, 3600),
+                    vol.Required(
+                        CONF_STREAMING_GAP, default=current[CONF_STREAMING_GAP]
+                    ): _seconds(10, 3600),
+                    vol.Required(
+                        CONF_WRITE_INTERVAL, default=current[CONF_WRITE_INTERVAL]
+                    ): _seconds(0, 60),
+                }
+            ),
+            description_placeholders={"name": self._vehicles().get(self._vin, "")},
+        )
+
+    async def async_step_energysite(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the energy site to tune."""
+        if user_input is not None:
+            self._site_id = user_input[CONF_ENERGYSITE]
+            return await self.async_step_energysite_options()
+
+        return self.async_show_form(
+            step_id="energysite",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_ENERGYSITE): _select(self._energysites())}
+            ),
+        )
+
+    async def async_step_energysite_options(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Tune the polling of an energy site."""
+        options = self.config_entry.options
+        defaults = {
+            CONF_LIVE_INTERVAL: ENERGY_LIVE_INTERVAL.total_seconds(),
+            CONF_INFO_INTERVAL: ENERGY_INFO_INTERVAL.total_seconds(),
+        }
+        energysites = dict(options.get(CONF_ENERGYSITES, {}))
+        settings = dict(energysites.get(self._site_id, {}))
+
+        if user_input is not None:
+            for key, value in user_input.items():
+                if value == defaults[key]:
+                    settings.pop(key, None)
+                else:
+                    settings[key] = value
+            _store(energysites, self._site_id, settings)
+            return self.async_create_entry(
+                data={**options, CONF_ENERGYSITES: energysites}
+            )
+
+        current = {key: settings.get(key, value) for key, value in defaults.items()}
+        return self.async_show_form(
+            step_id="energysite_options",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_LIVE_INTERVAL, default=current[CONF_LIVE_INTERVAL]
+                    ): _seconds(10, 3600),
+                    vol.Required(
+                        CONF_INFO_INTERVAL, default=current[CONF_INFO_INTERVAL]
+                    ): _seconds(10, 86400),
+                }
+            ),
+            description_placeholders={
+                "name": self._energysites().get(self._site_id, "")
+            },
+        )
+
+    async def async_step_stream_filters(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the streaming sensor to filter, and optionally a vehicle."""
+        if user_input is not None:
+            self._vin = user_input.get(CONF_VEHICLE, "")
+            self._field = user_input[CONF_FIELD]
+            return await self.async_step_stream_filter()
+
+        return self.async_show_form(
+            step_id="stream_filters",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_VEHICLE): _select(self._vehicles()),
+                    vol.Required(CONF_FIELD): SelectSelector(
+                        SelectSelectorConfig(
+                            options=sorted(STREAM_FILTER_DEFAULTS),
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                }
+            ),
+        )
+
+    async def async_step_stream_filter(
+        self, user_input: Mapping[str, Any] | None = None
+    ) -> FlowResult:
+        """Override the deadband and maximum rate of a streaming sensor."""
+        options = self.config_entry.options
+        defaults = dict(STREAM_FILTER_DEFAULTS[self._field])
+        shared = dict(options.get(CONF_STREAM_FILTERS, {}))
+        vehicles = dict(options.get(CONF_VEHICLES, {}))
+        settings = dict(vehicles.get(self._vin, {}))
+        if self._vin:
+            # A vehicle starts from the overrides of every vehicle
+            defaults.update(shared.get(self._field, {}))
+            overrides = dict(settings.get(CONF_STREAM_FILTERS, {}))
+        else:
+            overrides = shared
+
+        if user_input is not None:
+            _store(
+                overrides,
+                self._field,
+                dict(user_input) if dict(user_input) != defaults else {},
+            )
+            if not self._vin:
+                return self.async_create_entry(
+                    data={**options, CONF_STREAM_FILTERS: overrides}
+                )
+            _store(settings, CONF_STREAM_FILTERS, overrides)
+            _store(vehicles, self._vin, settings)
+            return self.async_create_entry(data={**options, CONF_VEHICLES: vehicles})
+
+        current = {**defaults, **overrides.get(self._field, {})}
+        return self.async_show_form(
+            step_id="stream_filter",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_DEADBAND, default=current[CONF_DEADBAND]
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            step="any",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_DEADBAND_PERCENT, default=current[CONF_DEADBAND_PERCENT]
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step="any",
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="%",
+                        )
+                    ),
+                    vol.Required(
+                        CONF_MAX_RATE, default=current[CONF_MAX_RATE]
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=100,
+                            step="any",
+                            mode=NumberSelectorMode.BOX,
+                            unit_of_measurement="/s",
+                        )
+                    ),
+                }
+            ),
+            description_placeholders={
+                "field": self._field,
+                "name": self._vehicles().get(self._vin, "every vehicle"),
+            },
+        )
+
+
+def _seconds(minimum: float, maximum: float) -> NumberSelector:
+    """Return a number box for an interval in seconds."""
+    return NumberSelector(
+        NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=0.1,
+            mode=NumberSelectorMode.BOX,
+            unit_of_measurement="s",
+        )
+    )
+
+
+def _select(options: dict[str, str]) -> SelectSelector:
+    """Return a dropdown of named options."""
+    return SelectSelector(
+        SelectSelectorConfig(
+            options=[
+                SelectOptionDict(value=value, label=label)
+                for value, label in options.items()
+            ],
+            mode=SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
+def _store(options: dict[str, Any], key: str, value: dict[str, Any]) -> None:
+    """Store the settings under a key, or remove the key when they are empty."""
+    if value:
+        options[key] = value
+    else:
+        options.pop(key, None)
@@ -5,10 +5,49 @@ from __future__ import annotations
 from enum import StrEnum, IntEnum
 import logging
 
+from tesla_fleet_api.const import TelemetryField
+
 DOMAIN = "teslemetry"
 
 STREAMING_GAP = 60000
 
+CONF_WRITE_INTERVAL = "write_interval"
+DEFAULT_WRITE_INTERVAL = 0
+CONF_STREAM_FILTERS = "stream_filters"
+CONF_FIELD = "field"
+CONF_DEADBAND = "deadband"
+CONF_DEADBAND_PERCENT = "deadband_percent"
+CONF_MAX_RATE = "max_rate"
+CONF_VEHICLES = "vehicles"
+CONF_VEHICLE = "vehicle"
+CONF_ENERGYSITES = "energysites"
+CONF_ENERGYSITE = "energysite"
+CONF_POLL_INTERVAL = "poll_interval"
+CONF_SLEEP_WAIT = "sleep_wait"
+CONF_STREAMING_GAP = "streaming_gap"
+CONF_LIVE_INTERVAL = "live_interval"
+CONF_INFO_INTERVAL = "info_interval"
+
+# High rate streaming fields, whose filters the options can override, with
+# their default deadband in the unit of the field and writes per second
+STREAM_FILTER_DEFAULTS: dict[str, dict[str, float]] = {
+    field: {CONF_DEADBAND: deadband, CONF_DEADBAND_PERCENT: 0, CONF_MAX_RATE: 1}
+    for field, deadband in (
+        (TelemetryField.DI_MOTOR_CURRENT_F, 1),
+        (TelemetryField.DI_MOTOR_CURRENT_R, 1),
+        (TelemetryField.DI_MOTOR_CURRENT_REL, 1),
+        (TelemetryField.DI_MOTOR_CURRENT_RER, 1),
+        (TelemetryField.DI_TORQUE_ACTUAL_F, 1),
+        (TelemetryField.DI_TORQUE_ACTUAL_R, 1),
+        (TelemetryField.DI_TORQUE_ACTUAL_REL, 1),
+        (TelemetryField.DI_TORQUE_ACTUAL_RER, 1),
+        (TelemetryField.LATERAL_ACCELERATION, 0.1),
+        (TelemetryField.LONGITUDINAL_ACCELERATION, 0.1),
+        (TelemetryField.PACK_CURRENT, 1),
+        (TelemetryField.PEDAL_POSITION, 1),
+    )
+}
+
 LOGGER = logging.getLogger(__package__)
 
 MODELS = {
@@ -25,6 +64,26 @@ class TeslemetryUpdateType(StrEnum):
     NONE = "none"
     POLLING = "polling"
     STREAMING = "streaming"
+    COMMAND = "command"
+    SNAPSHOT = "snapshot"
+
+
+class TeslemetryPriority(IntEnum):
+    """Teslemetry request priorities, most urgent first."""
+
+    COMMAND = 0
+    WAKE = 1
+    POLL = 2
+    INFO = 3
+
+
+class TeslemetryPollingProfile(StrEnum):
+    """Teslemetry vehicle polling profiles."""
+
+    DRIVING = "driving"
+    CHARGING = "charging"
+    PARKED = "parked"
+    ASLEEP = "asleep"
 
 
 class TeslemetryTimestamp(StrEnum):
@@ -1,6 +1,12 @@
 """Teslemetry Data Coordinator."""
 
+from collections import Counter
+from collections.abc import Iterable, Iterator, MutableMapping
+from dataclasses import dataclass
 from datetime import timedelta, datetime
+from enum import Enum
+import sys
+from time import monotonic
 from typing import Any
 
 from tesla_fleet_api import EnergySpecific, VehicleSpecific
@@ -14,16 +20,28 @@ from tesla_fleet_api.exceptions import (
     LoginRequired
 )
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
-from .const import LOGGER, TeslemetryState, DOMAIN
+from .const import (
+    LOGGER,
+    STREAMING_GAP,
+    TeslemetryPollingProfile,
+    TeslemetryPriority,
+    TeslemetryState,
+    DOMAIN,
+)
+from .scheduler import TeslemetryScheduler
+from .stream import TeslemetryStreamDispatcher
 
 VEHICLE_INTERVAL = timedelta(seconds=30)
+VEHICLE_STREAMING_INTERVAL = timedelta(minutes=10)
 VEHICLE_WAIT = timedelta(minutes=15)
 ENERGY_LIVE_INTERVAL = timedelta(seconds=30)
-ENERGY_INFO_INTERVAL = timedelta(seconds=30)
+# Site info only changes when a user acts, and commands refresh it straight away
+ENERGY_INFO_INTERVAL = timedelta(minutes=10)
 
 ENDPOINTS = [
     VehicleDataEndpoint.CHARGE_STATE,
@@ -34,29 +52,312 @@ ENDPOINTS = [
     VehicleDataEndpoint.VEHICLE_CONFIG,
 ]
 
+# Maximum age of each endpoint when it is not polled by the current profile
+ENDPOINT_TTL: dict[VehicleDataEndpoint, timedelta] = {
+    VehicleDataEndpoint.CHARGE_STATE: timedelta(minutes=5),
+    VehicleDataEndpoint.CLIMATE_STATE: timedelta(minutes=5),
+    VehicleDataEndpoint.DRIVE_STATE: timedelta(minutes=5),
+    VehicleDataEndpoint.LOCATION_DATA: timedelta(minutes=15),
+    VehicleDataEndpoint.VEHICLE_STATE: timedelta(minutes=5),
+    VehicleDataEndpoint.VEHICLE_CONFIG: timedelta(hours=6),
+}
+
+
+@dataclass(frozen=True)
+class PollingProfile:
+    """Interval scale and endpoints polled for a vehicle polling profile."""
+
+    scale: int
+    endpoints: list[VehicleDataEndpoint]
+
+
+# Charge, drive and vehicle state are always polled to detect profile changes.
+# An empty endpoint list only checks the vehicle state without waking it.
+PROFILES: dict[TeslemetryPollingProfile, PollingProfile] = {
+    TeslemetryPollingProfile.DRIVING: PollingProfile(
+        scale=1,
+        endpoints=[
+            VehicleDataEndpoint.CHARGE_STATE,
+            VehicleDataEndpoint.CLIMATE_STATE,
+            VehicleDataEndpoint.DRIVE_STATE,
+            VehicleDataEndpoint.LOCATION_DATA,
+            VehicleDataEndpoint.VEHICLE_STATE,
+        ],
+    ),
+    TeslemetryPollingProfile.CHARGING: PollingProfile(
+        scale=1,
+        endpoints=[
+            VehicleDataEndpoint.CHARGE_STATE,
+            VehicleDataEndpoint.DRIVE_STATE,
+            VehicleDataEndpoint.VEHICLE_STATE,
+        ],
+    ),
+    TeslemetryPollingProfile.PARKED: PollingProfile(
+        scale=2,
+        endpoints=[
+            VehicleDataEndpoint.CHARGE_STATE,
+            VehicleDataEndpoint.CLIMATE_STATE,
+            VehicleDataEndpoint.DRIVE_STATE,
+            VehicleDataEndpoint.VEHICLE_STATE,
+        ],
+    ),
+    TeslemetryPollingProfile.ASLEEP: PollingProfile(scale=1, endpoints=[]),
+}
+
+
+def _plain_key(key: str | Enum) -> str:
+    """Return the string of a key, which may be a tesla_fleet_api enum."""
+    return key.value if isinstance(key, Enum) else key
+
+
+def section_prefixes(sections: Iterable[str | Enum]) -> tuple[str, ...]:
+    """Return the prefixes of the flattened keys in each response section."""
+    return tuple(f"{_plain_key(section)}_" for section in sections)
+
+
+class TeslemetryFlattener:
+    """Flatten responses incrementally using a cached key path table."""
+
+    def __init__(self) -> None:
+        """Initialize the flattener."""
+        self._paths: dict[tuple[str | None, str], str] = {}
+
+    def flatten(
+        self,
+        data: dict[str, Any],
+        previous: dict[str, Any],
+        sections: Iterable[str | Enum] | None = None,
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Return the flattened data and the keys that differ from previous.
+
+        When sections is provided, data is a partial response that is merged
+        over previous, and only keys of those sections can be removed.
+        """
+        result: dict[str, Any] = {}
+        changed: set[str] = set()
+        self._flatten(data, None, previous, result, changed)
+        if sections is not None:
+            removed = previous.keys() - result.keys()
+            result = previous | result
+            if prefixes := section_prefixes(sections):
+                for key in removed:
+                    if key.startswith(prefixes):
+                        del result[key]
+                        changed.add(key)
+        elif len(result) != len(previous) or changed:
+            # Keys that are no longer present have changed too
+            changed.update(previous.keys() - result.keys())
+        return result, changed
+
+    def _flatten(
+        self,
+        data: dict[str, Any],
+        parent: str | None,
+        previous: dict[str, Any],
+        result: dict[str, Any],
+        changed: set[str],
+    ) -> None:
+        """Flatten a level of the data structure into result."""
+        paths = self._paths
+        for key, value in data.items():
+            if (path := paths.get((parent, key))) is None:
+                path = paths[(parent, key)] = f"{parent}_{key}" if parent else key
+            if isinstance(value, dict):
+                self._flatten(value, path, previous, result, changed)
+            else:
+                result[path] = value
+                if path not in previous or previous[path] != value:
+                    changed.add(path)
+
+
+_MISSING = object()
+
+
+class TeslemetryValueStore(MutableMapping[str, Any]):
+    """Flattened vehicle values held in slots of a preallocated list.
+
+    The key to slot index is interned and shared by every vehicle, so each
+    vehicle only holds a list of values. Readers resolve a slot once and
+    then read it by index.
+    """
+
+    _index: dict[str, int] = {}
+    _keys: list[str] = []
+    _paths: dict[tuple[str | None, str], str] = {}
+
+    def __init__(self) -> None:
+        """Initialize the value store."""
+        self._values: list[Any] = [_MISSING] * len(self._keys)
+        # Generation in which each slot was last seen in a response
+        self._seen: list[int] = [0] * len(self._keys)
+        self._generation = 0
+        self._len = 0
+
+    @classmethod
+    def slot(cls, key: str | Enum) -> int:
+        """Return the slot of a key, allocating one for a new key."""
+        # Enum keys share the slot of their value
+        key = _plain_key(key)
+        if (slot := cls._index.get(key)) is None:
+            key = sys.intern(key)
+            slot = cls._index[key] = len(cls._keys)
+            cls._keys.append(key)
+        return slot
+
+    def value(self, slot: int, default: Any = None) -> Any:
+        """Return the value in a slot."""
+        if slot < len(self._values) and (value := self._values[slot]) is not _MISSING:
+            return value
+        return default
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a key."""
+        if (slot := self._index.get(key)) is None:
+            return default
+        return self.value(slot, default)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of a key or raise KeyError."""
+        if (value := self.get(key, _MISSING)) is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        """Return if a key has a value."""
+        return isinstance(key, str) and self.get(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set the value of a key."""
+        self._set(self.slot(key), value)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove the value of a key."""
+        if key not in self:
+            raise KeyError(key)
+        self._values[self._index[key]] = _MISSING
+        self._len -= 1
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the keys that have a value."""
+        return (
+            key
+            for key, value in zip(self._keys, self._values)
+            if value is not _MISSING
+        )
 
-def flatten(data: dict[str, Any], parent: str | None = None) -> dict[str, Any]:
-    """Flatten the data structure."""
-    result = {}
-    for key, value in data.items():
-        if parent:
-            key = f"{parent}_{key}"
-        if isinstance(value, dict):
-            result.update(flatten(value, key))
-        else:
-            result[key] = value
-    return result
-
-
-class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    def __len__(self) -> int:
+        """Return the number of keys that have a value."""
+        return self._len
+
+    def _set(self, slot: int, value: Any) -> bool:
+        """Set the value in a slot and return if it changed."""
+        values = self._values
+        if slot >= len(values):
+            grow = len(self._keys) - len(values)
+            values.extend([_MISSING] * grow)
+            self._seen.extend([0] * grow)
+        previous = values[slot]
+        if previous is _MISSING:
+            self._len += 1
+        elif previous == value:
+            return False
+        values[slot] = value
+        return True
+
+    def merge(
+        self, data: dict[str, Any], sections: Iterable[str | Enum] | None = None
+    ) -> set[str]:
+        """Flatten a response into the store and return the keys that changed.
+
+        When sections is provided, data is a partial response and only keys
+        of those sections can be removed, otherwise any key not in data is.
+        """
+        self._generation += 1
+        changed: set[str] = set()
+        self._merge(data, None, changed)
+        prefixes = None
+        if sections is not None:
+            if not (prefixes := section_prefixes(sections)):
+                return changed
+        values, seen, generation = self._values, self._seen, self._generation
+        for slot, (key, value) in enumerate(zip(self._keys, values)):
+            if (
+                seen[slot] != generation
+                and value is not _MISSING
+                and (prefixes is None or key.startswith(prefixes))
+            ):
+                values[slot] = _MISSING
+                self._len -= 1
+                changed.add(key)
+        return changed
+
+    def _merge(
+        self, data: dict[str, Any], parent: str | None, changed: set[str]
+    ) -> None:
+        """Flatten a level of the data structure into the store."""
+        paths = self._paths
+        for key, value in data.items():
+            if (path := paths.get((parent, key))) is None:
+                path = paths[(parent, key)] = sys.intern(
+                    f"{parent}_{key}" if parent else key
+                )
+            if isinstance(value, dict):
+                self._merge(value, path, changed)
+                continue
+            slot = self.slot(path)
+            if self._set(slot, value):
+                changed.add(path)
+            self._seen[slot] = self._generation
+
+
+class TeslemetryDataCoordinator(DataUpdateCoordinator[MutableMapping[str, Any]]):
+    """Base coordinator that only calls back listeners whose keys changed."""
+
+    changed_keys: set[str] | None = None
+    _notified_success: bool = True
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose keys have changed, or all of them."""
+        changed_keys = self.changed_keys
+        if changed_keys is None or self._notified_success != self.last_update_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        for update_callback, keys in list(self._listeners.values()):
+            if keys is None or not changed_keys.isdisjoint(keys):
+                update_callback()
+
+    @callback
+    def async_set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the update interval, rescheduling a pending refresh."""
+        if update_interval == self.update_interval:
+            return
+        self.update_interval = update_interval
+        if self._unsub_refresh:
+            self._schedule_refresh()
+
+
+class TeslemetryVehicleDataCoordinator(TeslemetryDataCoordinator):
     """Class to manage fetching data from the Teslemetry API."""
 
     updated_once = False
+    snapshot_at: int | None = None
+    profile = TeslemetryPollingProfile.ASLEEP
     pre2021: bool
     last_active: datetime
+    interval = VEHICLE_INTERVAL
+    wait = VEHICLE_WAIT
+    streaming_gap = STREAMING_GAP
+    _cancel_watchdog: CALLBACK_TYPE | None = None
 
     def __init__(
-        self, hass: HomeAssistant, api: VehicleSpecific, product: dict
+        self,
+        hass: HomeAssistant,
+        api: VehicleSpecific,
+        product: dict,
+        dispatcher: TeslemetryStreamDispatcher,
+        scheduler: TeslemetryScheduler,
     ) -> None:
         """Initialize Teslemetry Vehicle Update Coordinator."""
         super().__init__(
@@ -66,21 +367,188 @@ class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=VEHICLE_INTERVAL,
         )
         self.api = api
+        self.scheduler = scheduler
+        self.dispatcher = dispatcher
+        self.streaming_keys: Counter[str] = Counter()
+        self.fetched_at: dict[VehicleDataEndpoint, float] = {}
 
-        self.data = flatten(product)
+        self.data = TeslemetryValueStore()
+        self.data.merge(product)
         self.last_active = datetime.now()
         if (self.api.pre2021):
             LOGGER.info("Teslemetry will let {} sleep".format(product["vin"]))
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    @callback
+    def async_configure(
+        self, interval: timedelta, wait: timedelta, streaming_gap: int
+    ) -> None:
+        """Change the polling interval, sleep wait and streaming gap."""
+        if (interval, wait, streaming_gap) == (
+            self.interval,
+            self.wait,
+            self.streaming_gap,
+        ):
+            return
+        self.interval = interval
+        self.wait = wait
+        self.streaming_gap = streaming_gap
+        if self.updated_once:
+            self._async_schedule_poll()
+        else:
+            self.async_set_update_interval(interval)
+
+    @property
+    def has_data(self) -> bool:
+        """Return if the data is from polling or a snapshot, not just products."""
+        return self.updated_once or self.snapshot_at is not None
+
+    @callback
+    def async_hydrate(self, data: dict[str, Any], saved_at: int) -> None:
+        """Restore data from a snapshot, keeping the fresher products payload."""
+        product = dict(self.data)
+        self.data.merge(data)
+        self.data.merge(product, ())
+        self.snapshot_at = saved_at
+
+    @callback
+    def async_add_streaming_key(self, key: str) -> CALLBACK_TYPE:
+        """Record that a polled key is also kept up to date by the stream."""
+        self.streaming_keys[key] += 1
+
+        @callback
+        def remove_streaming_key() -> None:
+            """Remove the streaming key."""
+            self.streaming_keys[key] -= 1
+            if self.streaming_keys[key] <= 0:
+                del self.streaming_keys[key]
+
+        return remove_streaming_key
+
+    def _async_polling_profile(
+        self, data: TeslemetryValueStore
+    ) -> TeslemetryPollingProfile:
+        """Return the polling profile for the current vehicle state."""
+        if data.get("state") != TeslemetryState.ONLINE:
+            return TeslemetryPollingProfile.ASLEEP
+        if data.get("drive_state_shift_state") not in (None, "P") or data.get(
+            "vehicle_state_is_user_present"
+        ):
+            return TeslemetryPollingProfile.DRIVING
+        if data.get("charge_state_charging_state") in ("Starting", "Charging"):
+            return TeslemetryPollingProfile.CHARGING
+        return TeslemetryPollingProfile.PARKED
+
+    def _async_stale_endpoints(self) -> list[VehicleDataEndpoint]:
+        """Return the endpoints of the profile and any others past their TTL."""
+        if not self.updated_once:
+            return ENDPOINTS
+        if not (endpoints := PROFILES[self.profile].endpoints):
+            return endpoints
+        now = monotonic()
+        return [
+            endpoint
+            for endpoint in ENDPOINTS
+            if endpoint in endpoints
+            or endpoint not in self.fetched_at
+            or now - self.fetched_at[endpoint] >= ENDPOINT_TTL[endpoint].total_seconds()
+        ]
+
+    def _async_polling_interval(self, interval: timedelta) -> timedelta:
+        """Return a polling interval based on streaming coverage and recency."""
+        if not self.dispatcher.received_within(self.streaming_gap / 1000):
+            return interval
+        polled_keys = set().union(
+            *(keys for _, keys in self._listeners.values() if keys)
+        ).intersection(self.data)
+        if not polled_keys or interval >= VEHICLE_STREAMING_INTERVAL:
+            return interval
+        coverage = len(polled_keys.intersection(self.streaming_keys)) / len(
+            polled_keys
+        )
+        return interval + (VEHICLE_STREAMING_INTERVAL - interval) * coverage
+
+    async def _async_fetch(
+        self, endpoints: list[VehicleDataEndpoint]
+    ) -> tuple[dict[str, Any], list[VehicleDataEndpoint] | None]:
+        """Fetch vehicle data, or only the vehicle state if asleep.
+
+        Returns the response and the endpoints it contains, or None when
+        every endpoint was requested.
+        """
+        if not endpoints:
+            vehicle = (
+                await self.scheduler.async_call(
+                    TeslemetryPriority.POLL, self.api.vehicle()
+                )
+            )["response"]
+            if vehicle["state"] != TeslemetryState.ONLINE:
+                return {"state": vehicle["state"]}, []
+            # The vehicle woke up, so everything may have changed
+            endpoints = ENDPOINTS
+        data = (
+            await self.scheduler.async_call(
+                TeslemetryPriority.POLL, self.api.vehicle_data(endpoints=endpoints)
+            )
+        )["response"]
+        return data, None if endpoints is ENDPOINTS else endpoints
+
+    @callback
+    def _async_schedule_watchdog(self) -> None:
+        """Poll again quickly if the stream goes silent during a backoff."""
+        self._async_cancel_watchdog()
+        self._cancel_watchdog = async_call_later(
+            self.hass, self.streaming_gap / 1000, self._async_check_stream
+        )
+
+    @callback
+    def _async_check_stream(self, _: datetime) -> None:
+        """Check the stream is still delivering, otherwise refresh now."""
+        self._cancel_watchdog = None
+        if self.dispatcher.received_within(self.streaming_gap / 1000):
+            self._async_schedule_watchdog()
+        else:
+            LOGGER.debug("Stream for %s went silent, resuming polling", self.name)
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_cancel_watchdog(self) -> None:
+        """Cancel the stream watchdog."""
+        if self._cancel_watchdog:
+            self._cancel_watchdog()
+            self._cancel_watchdog = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel the stream watchdog and shutdown the coordinator."""
+        self._async_cancel_watchdog()
+        await super().async_shutdown()
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        """Set the update interval for the polling profile and streaming."""
+        interval = self.interval * PROFILES[self.profile].scale
+        self.async_set_update_interval(self._async_polling_interval(interval))
+        if self.update_interval > interval:
+            # Streaming is covering for polling, but watch for it going silent
+            self._async_schedule_watchdog()
+        else:
+            self._async_cancel_watchdog()
+
+    async def _async_update_data(self) -> TeslemetryValueStore:
         """Update vehicle data using Teslemetry API."""
 
-        self.update_interval = VEHICLE_INTERVAL
+        self.update_interval = self.interval
+        self._async_cancel_watchdog()
+        self.changed_keys = None
+        endpoints = self._async_stale_endpoints()
 
         try:
             #raise SubscriptionRequired
-            data = (await self.api.vehicle_data(endpoints=ENDPOINTS))["response"]
+            data, endpoints = await self._async_fetch(endpoints)
         except VehicleOffline:
+            self.profile = TeslemetryPollingProfile.ASLEEP
+            self.changed_keys = (
+                set() if self.data.get("state") == TeslemetryState.OFFLINE else {"state"}
+            )
             self.data["state"] = TeslemetryState.OFFLINE
             return self.data
         except InvalidToken as e:
@@ -102,15 +570,46 @@ class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         except TypeError as e:
             raise UpdateFailed("Invalid response from Teslemetry") from e
 
+        if endpoints == []:
+            # Only the state of a sleeping vehicle was checked
+            self.changed_keys = (
+                set() if self.data.get("state") == data["state"] else {"state"}
+            )
+            self.data["state"] = data["state"]
+            return self.data
+
         self.hass.bus.fire("teslemetry_vehicle_data", data)
 
+        now = monotonic()
+        for endpoint in endpoints or ENDPOINTS:
+            self.fetched_at[endpoint] = now
+
+        # Drive state is only complete when it includes the location data
+        sections = endpoints and [
+            endpoint
+            for endpoint in endpoints
+            if endpoint != VehicleDataEndpoint.DRIVE_STATE
+            or VehicleDataEndpoint.LOCATION_DATA in endpoints
+        ]
+        changed_keys = self.data.merge(data, sections)
+        data = self.data
+        # Until the first update every key must be considered changed
+        self.changed_keys = changed_keys if self.updated_once else None
+        self.updated_once = True
+        self.snapshot_at = None
+
+        profile = self._async_polling_profile(data)
+        if profile != self.profile:
+            LOGGER.debug("Polling %s using the %s profile", self.name, profile)
+            self.profile = profile
+        self._async_schedule_poll()
+
         if(self.api.pre2021):
             # Handle pre-2021 vehicles which cannot sleep by themselves
-            if data["charge_state"].get("charging_state") == "Charging" or data["vehicle_state"].get("is_user_present") or data["vehicle_state"].get("sentry_mode"):
+            if data.get("charge_state_charging_state") == "Charging" or data.get("vehicle_state_is_user_present") or data.get("vehicle_state_sentry_mode"):
                 # Vehicle is active, reset timer
                 LOGGER.debug("Vehicle is active")
                 self.last_active = datetime.now()
-                self.update_interval = VEHICLE_INTERVAL
             else:
                 elapsed = (datetime.now() - self.last_active)
                 if elapsed > timedelta(minutes=20):
@@ -120,16 +619,16 @@ class TeslemetryVehicleDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 elif elapsed > timedelta(minutes=15):
                     # Stop polling for 15 minutes
                     LOGGER.debug("Starting sleep period")
-                    self.update_interval = VEHICLE_WAIT
+                    self._async_cancel_watchdog()
+                    self.update_interval = self.wait
 
-        self.updated_once = True
-        return flatten(data)
+        return data
 
 
-class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class TeslemetryEnergySiteLiveCoordinator(TeslemetryDataCoordinator):
     """Class to manage fetching energy site live status from the Teslemetry API."""
 
-    def __init__(self, hass: HomeAssistant, api: EnergySpecific, uid: str, ) -> None:
+    def __init__(self, hass: HomeAssistant, api: EnergySpecific, uid: str, scheduler: TeslemetryScheduler) -> None:
         """Initialize Teslemetry Energy Site Live coordinator."""
         super().__init__(
             hass,
@@ -138,13 +637,19 @@ class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]])
             update_interval=ENERGY_LIVE_INTERVAL,
         )
         self.api = api
+        self.scheduler = scheduler
 
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update energy site data using Teslemetry API."""
 
+        self.changed_keys = None
         try:
-            data = (await self.api.live_status())["response"]
+            data = (
+                await self.scheduler.async_call(
+                    TeslemetryPriority.POLL, self.api.live_status()
+                )
+            )["response"]
         except InvalidToken as e:
             raise ConfigEntryAuthFailed from e
         except SubscriptionRequired as e:
@@ -161,13 +666,19 @@ class TeslemetryEnergySiteLiveCoordinator(DataUpdateCoordinator[dict[str, Any]])
             wc["din"]: wc for wc in (data.get("wall_connectors") or [])
         }
 
+        if self.data is not None:
+            self.changed_keys = {
+                key
+                for key in data.keys() | self.data.keys()
+                if data.get(key) != self.data.get(key)
+            }
         return data
 
 
-class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class TeslemetryEnergySiteInfoCoordinator(TeslemetryDataCoordinator):
     """Class to manage fetching energy site info from the Teslemetry API."""
 
-    def __init__(self, hass: HomeAssistant, api: EnergySpecific, uid: str, product: dict) -> None:
+    def __init__(self, hass: HomeAssistant, api: EnergySpecific, uid: str, product: dict, scheduler: TeslemetryScheduler) -> None:
         """Initialize Teslemetry Energy Info coordinator."""
         super().__init__(
             hass,
@@ -176,14 +687,32 @@ class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]])
             update_interval=ENERGY_INFO_INTERVAL,
         )
         self.api = api
+        self.scheduler = scheduler
+        self.flattener = TeslemetryFlattener()
 
         self.data = product
 
+    @callback
+    def async_merge(self, values: dict[str, Any]) -> None:
+        """Merge values set by a command before the next refresh confirms them."""
+        changed_keys = {
+            key for key, value in values.items() if self.data.get(key) != value
+        }
+        if changed_keys:
+            self.data = self.data | values
+            self.changed_keys = changed_keys
+            self.async_update_listeners()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update energy site data using Teslemetry API."""
 
+        self.changed_keys = None
         try:
-            data = (await self.api.site_info())["response"]
+            data = (
+                await self.scheduler.async_call(
+                    TeslemetryPriority.INFO, self.api.site_info()
+                )
+            )["response"]
         except InvalidToken as e:
             raise ConfigEntryAuthFailed from e
         except SubscriptionRequired as e:
@@ -195,4 +724,5 @@ class TeslemetryEnergySiteInfoCoordinator(DataUpdateCoordinator[dict[str, Any]])
 
         self.hass.bus.fire("teslemetry_site_info", data)
 
-        return flatten(data)
+        data, self.changed_keys = self.flattener.flatten(data, self.data)
+        return data
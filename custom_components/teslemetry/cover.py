@@ -17,6 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN, TeslemetryCoverStates, TeslemetryTimestamp
 from .entity import TeslemetryVehicleEntity
+from .helpers import decode_enum
 from .models import TeslemetryVehicleData
 
 
@@ -41,6 +42,13 @@ async def async_setup_entry(
 class TeslemetryWindowEntity(TeslemetryVehicleEntity, CoverEntity):
     """Cover entity for current charge."""
 
+    coordinator_keys = (
+        "vehicle_state_fd_window",
+        "vehicle_state_fp_window",
+        "vehicle_state_rd_window",
+        "vehicle_state_rp_window",
+    )
+
     _attr_device_class = CoverDeviceClass.WINDOW
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
@@ -70,16 +78,20 @@ class TeslemetryWindowEntity(TeslemetryVehicleEntity, CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Vent windows."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.window_control(command=WindowCommand.VENT))
+        await self.handle_command(
+            self.api.window_control(command=WindowCommand.VENT), target=False
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close windows."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.window_control(command=WindowCommand.CLOSE))
+        await self.handle_command(
+            self.api.window_control(command=WindowCommand.CLOSE),
+            self._attr_is_closed,
+            True,
+        )
         self._attr_is_closed = True
         self.async_write_ha_state()
 
@@ -87,6 +99,7 @@ class TeslemetryWindowEntity(TeslemetryVehicleEntity, CoverEntity):
 class TeslemetryChargePortEntity(TeslemetryVehicleEntity, CoverEntity):
     """Cover entity for the charge port."""
 
+    streaming_decoder = staticmethod(decode_enum)
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
 
@@ -116,16 +129,18 @@ class TeslemetryChargePortEntity(TeslemetryVehicleEntity, CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open windows."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.charge_port_door_open())
+        await self.handle_command(
+            self.api.charge_port_door_open(), self._attr_is_closed, False
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close windows."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.charge_port_door_close())
+        await self.handle_command(
+            self.api.charge_port_door_close(), self._attr_is_closed, True
+        )
         self._attr_is_closed = True
         self.async_write_ha_state()
 
@@ -151,8 +166,9 @@ class TeslemetryFrontTrunkEntity(TeslemetryVehicleEntity, CoverEntity):
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open front trunk."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.actuate_trunk(Trunk.FRONT))
+        await self.handle_command(
+            self.api.actuate_trunk(Trunk.FRONT), self._attr_is_closed, False
+        )
         self._attr_is_closed = False
         self.async_write_ha_state()
 
@@ -187,8 +203,9 @@ class TeslemetryRearTrunkEntity(TeslemetryVehicleEntity, CoverEntity):
         """Open rear trunk."""
         if self.is_closed is not False:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.actuate_trunk(Trunk.REAR))
+            await self.handle_command(
+                self.api.actuate_trunk(Trunk.REAR), self._attr_is_closed, False
+            )
             self._attr_is_closed = False
             self.async_write_ha_state()
 
@@ -196,7 +213,8 @@ class TeslemetryRearTrunkEntity(TeslemetryVehicleEntity, CoverEntity):
         """Close rear trunk."""
         if self.is_closed is not True:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.actuate_trunk(Trunk.REAR))
+            await self.handle_command(
+                self.api.actuate_trunk(Trunk.REAR), self._attr_is_closed, True
+            )
             self._attr_is_closed = True
             self.async_write_ha_state()
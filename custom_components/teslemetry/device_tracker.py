@@ -11,6 +11,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity import TeslemetryVehicleEntity
+from .helpers import decode_location
 from .models import TeslemetryVehicleData
 
 
@@ -62,6 +63,12 @@ class TeslemetryDeviceTrackerEntity(TeslemetryVehicleEntity, TrackerEntity):
 class TeslemetryDeviceTrackerLocationEntity(TeslemetryDeviceTrackerEntity):
     """Vehicle Location Device Tracker Class."""
 
+    streaming_decoder = staticmethod(decode_location)
+    coordinator_keys = (
+        "drive_state_latitude",
+        "drive_state_longitude",
+    )
+
     key = "location"
     streaming_key = TelemetryField.LOCATION
 
@@ -86,8 +93,15 @@ class TeslemetryDeviceTrackerLocationEntity(TeslemetryDeviceTrackerEntity):
 class TeslemetryDeviceTrackerRouteEntity(TeslemetryDeviceTrackerEntity):
     """Vehicle Navigation Device Tracker Class."""
 
+    coordinator_keys = (
+        "drive_state_active_route_latitude",
+        "drive_state_active_route_longitude",
+        "drive_state_active_route_destination",
+    )
+
     key = "route"
     streaming_key = None
+    _fingerprint_properties = ("location_name",)
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the device tracker."""
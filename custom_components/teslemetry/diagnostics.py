@@ -9,6 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
+from .session import session_stats
 
 VEHICLE_REDACT = [
     "id",
@@ -49,4 +50,10 @@ async def async_get_config_entry_diagnostics(
     ]
 
     # Return only the relevant children
-    return {"vehicles": vehicles, "energysites": energysites, "scopes": entry.runtime_data.scopes}
+    return {
+        "vehicles": vehicles,
+        "energysites": energysites,
+        "scopes": entry.runtime_data.scopes,
+        "session": session_stats(entry.runtime_data.session),
+        "scheduler": entry.runtime_data.scheduler.stats,
+    }
@@ -1,22 +1,27 @@
 """Teslemetry parent entity class."""
 
+from collections.abc import Callable
+from datetime import datetime
 from typing import Any
-from time import time
+from time import monotonic, time
 
-from tesla_fleet_api import EnergySpecific, VehicleSpecific
+from tesla_fleet_api import VehicleSpecific
 from tesla_fleet_api.const import TelemetryField
+from teslemetry_stream import TeslemetryStream
 
+from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
     LOGGER,
+    TeslemetryPriority,
     TeslemetryTimestamp,
     TeslemetryUpdateType,
-    STREAMING_GAP,
 )
 from .coordinator import (
     TeslemetryEnergySiteInfoCoordinator,
@@ -24,42 +29,135 @@ from .coordinator import (
     TeslemetryVehicleDataCoordinator,
 )
 from .models import TeslemetryEnergyData, TeslemetryVehicleData
-from .helpers import wake_up_vehicle, handle_command, handle_vehicle_command
+from .helpers import (
+    TeslemetryCommandQueue,
+    TeslemetryWakeUpManager,
+    decode_passthrough,
+    wake_up_vehicle,
+    handle_command,
+)
+from .stream import TeslemetryStreamDispatcher
+
+
+class TeslemetryCoalescingMixin:
+    """Coalesce bursts of streaming state writes for an entity."""
+
+    _write_interval: float = 0
+    _last_write: float = 0
+    _cancel_write: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_write)
+
+    @callback
+    def async_write_coalesced(self) -> None:
+        """Write state at most once per interval, keeping the latest value."""
+        if not self._write_interval:
+            self.async_write_ha_state()
+            return
+        if self._cancel_write:
+            # A trailing write is already scheduled and will use the latest value
+            return
+        now = monotonic()
+        if (delay := self._last_write + self._write_interval - now) <= 0:
+            self._last_write = now
+            self.async_write_ha_state()
+            return
+        self._cancel_write = async_call_later(self.hass, delay, self._async_flush_write)
+
+    @callback
+    def _async_flush_write(self, _: datetime) -> None:
+        """Write the latest coalesced state."""
+        self._cancel_write = None
+        self._last_write = monotonic()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_write(self) -> None:
+        """Cancel a pending coalesced write."""
+        if self._cancel_write:
+            self._cancel_write()
+            self._cancel_write = None
+
+
+class TeslemetryVehicleContext:
+    """Read shared vehicle references from the vehicle instead of each entity."""
 
+    vehicle: TeslemetryVehicleData
 
-class TeslemetryVehicleStreamEntity:
+    @property
+    def api(self) -> VehicleSpecific:
+        """Return the vehicle API."""
+        return self.vehicle.api
+
+    @property
+    def stream(self) -> TeslemetryStream:
+        """Return the stream of the vehicle."""
+        return self.vehicle.stream
+
+    @property
+    def dispatcher(self) -> TeslemetryStreamDispatcher:
+        """Return the stream dispatcher of the vehicle."""
+        return self.vehicle.dispatcher
+
+    @property
+    def vin(self) -> str:
+        """Return the VIN of the vehicle."""
+        return self.vehicle.vin
+
+    @property
+    def wakeup(self) -> TeslemetryWakeUpManager:
+        """Return the wake up manager of the vehicle."""
+        return self.vehicle.wakeup
+
+    @property
+    def commands(self) -> TeslemetryCommandQueue:
+        """Return the command queue of the vehicle."""
+        return self.vehicle.commands
+
+    @property
+    def _write_interval(self) -> float:
+        """Return the minimum interval between streaming state writes."""
+        return self.vehicle.write_interval
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info of the vehicle."""
+        return self.vehicle.device
+
+
+class TeslemetryVehicleStreamEntity(TeslemetryVehicleContext, TeslemetryCoalescingMixin):
     """Parent class for Teslemetry Vehicle Stream entities."""
 
     _attr_has_entity_name = True
+    # Decodes the raw streaming value once for every listener of the field
+    streaming_decoder: Callable[[Any], Any] = staticmethod(decode_passthrough)
 
     def __init__(
         self, data: TeslemetryVehicleData, streaming_key: TelemetryField
     ) -> None:
         """Initialize common aspects of a Teslemetry entity."""
+        self.vehicle = data
         self.streaming_key = streaming_key
 
         self._attr_translation_key = f"stream_{streaming_key.lower()}"
-        self.stream = data.stream
-        self.vin = data.vin
-
         self._attr_unique_id = f"{data.vin}-stream_{streaming_key.lower()}"
-        self._attr_device_info = data.device
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        if self.stream.server:
-            self.async_on_remove(
-                self.stream.async_add_listener(
-                    self._handle_stream_update,
-                    {"vin": self.vin, "data": {self.streaming_key: None}},
-                )
+        self.async_on_remove(
+            self.dispatcher.async_add_listener(
+                self.streaming_key, self._handle_stream_update, self.streaming_decoder
             )
+        )
 
     def _handle_stream_update(self, data: dict[str, Any]) -> None:
         """Handle updated data from the stream."""
         self._async_value_from_stream(data["data"][self.streaming_key])
-        self.async_write_ha_state()
+        self.async_write_coalesced()
 
 
 class TeslemetryEntity(
@@ -69,21 +167,31 @@ class TeslemetryEntity(
         | TeslemetryEnergySiteInfoCoordinator
     ]
 ):
-    """Parent class for all Teslemetry entities."""
+    """Parent class for all Teslemetry entities.
+
+    Coordinator updates only write state when the fingerprint of the entity
+    changes. The fingerprint covers availability and every _attr_ attribute,
+    so state properties should return an _attr_ attribute. A property that
+    computes its value instead must be listed in _fingerprint_properties,
+    otherwise its changes are never written.
+    """
 
     _attr_has_entity_name = True
+    _fingerprint: tuple[Any, ...] | None = None
+    # State properties that are not backed by an _attr_ attribute
+    _fingerprint_properties: tuple[str, ...] = ()
+    # Coordinator keys read by the entity in addition to its own key
+    coordinator_keys: tuple[str | None, ...] = ()
 
     def __init__(
         self,
         coordinator: TeslemetryVehicleDataCoordinator
         | TeslemetryEnergySiteLiveCoordinator
         | TeslemetryEnergySiteInfoCoordinator,
-        api: VehicleSpecific | EnergySpecific,
         key: str,
     ) -> None:
         """Initialize common aspects of a Teslemetry entity."""
-        super().__init__(coordinator)
-        self.api = api
+        super().__init__(coordinator, frozenset((key, *self.coordinator_keys)))
         self.key = key
         self._attr_translation_key = self.key
         self._async_update_attrs()
@@ -131,23 +239,57 @@ class TeslemetryEntity(
 
     async def handle_command(self, command) -> dict[str, Any]:
         """Handle a command."""
-        return await handle_command(command)
+        return await handle_command(
+            self.coordinator.scheduler.async_call(TeslemetryPriority.COMMAND, command)
+        )
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._async_update_attrs()
-        self.async_write_ha_state()
+        if self._async_state_changed():
+            self.async_write_ha_state()
+
+    def _async_fingerprint(self) -> tuple[Any, ...]:
+        """Return a cheap fingerprint of the availability and attributes."""
+        return (
+            self.available,
+            *(getattr(self, name) for name in self._fingerprint_properties),
+            *(
+                value
+                for attr, value in self.__dict__.items()
+                # Cached properties store attributes with an extra underscore
+                if attr.startswith(("_attr_", "__attr_"))
+                and not attr.endswith("_attr_extra_state_attributes")
+            ),
+        )
+
+    def _async_state_changed(self) -> bool:
+        """Return if the state has changed since it was last written."""
+        return self._async_fingerprint() != self._fingerprint
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state to the state machine and record its fingerprint."""
+        self._fingerprint = self._async_fingerprint()
+        super().async_write_ha_state()
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the entity."""
         raise NotImplementedError()
 
 
-class TeslemetryVehicleEntity(TeslemetryEntity):
+class TeslemetryVehicleEntity(
+    TeslemetryVehicleContext, TeslemetryCoalescingMixin, TeslemetryEntity
+):
     """Parent class for Teslemetry Vehicle entities."""
 
     _updated_at: int = 0
     _updated_by: TeslemetryUpdateType = TeslemetryUpdateType.NONE
+    _cancel_hold: CALLBACK_TYPE | None = None
+    # The streaming key reports the same attributes that commands change
+    _stream_confirms_commands: bool = True
+    # Decodes the raw streaming value once for every listener of the field
+    streaming_decoder: Callable[[Any], Any] = staticmethod(decode_passthrough)
 
     def __init__(
         self,
@@ -157,65 +299,143 @@ class TeslemetryVehicleEntity(TeslemetryEntity):
         streaming_key: TelemetryField | None = None,
     ) -> None:
         """Initialize common aspects of a Teslemetry entity."""
+        self.vehicle = data
         self.timestamp_key = timestamp_key
         self.streaming_key = streaming_key
-        self.stream = data.stream
-        self.vin = data.vin
 
         self._attr_unique_id = f"{data.vin}-{key}"
-        self.wakelock = data.wakelock
+        self._slot = data.coordinator.data.slot(key)
+        super().__init__(data.coordinator, key)
 
-        self._attr_device_info = data.device
-        super().__init__(data.coordinator, data.api, key)
+        if (snapshot_at := data.coordinator.snapshot_at) is not None:
+            # Values are from the snapshot until polling or the stream replace them
+            self._updated_by = TeslemetryUpdateType.SNAPSHOT
+            self._updated_at = snapshot_at
+            self._async_update_extra_attrs()
+
+    @property
+    def _value(self) -> Any | None:
+        """Return the value of the entity key from its slot."""
+        return self.coordinator.data.value(self._slot)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        if self.stream.server and self.streaming_key:
+        self.async_on_remove(self._async_cancel_hold)
+        if self.streaming_key:
             self.async_on_remove(
-                self.stream.async_add_listener(
+                self.dispatcher.async_add_listener(
+                    self.streaming_key,
                     self._handle_stream_update,
-                    {"vin": self.vin, "data": {self.streaming_key: None}},
+                    self.streaming_decoder,
                 )
             )
+            self.async_on_remove(self.coordinator.async_add_streaming_key(self.key))
 
     def _handle_stream_update(self, data: dict[str, Any]) -> None:
         """Handle updated data from the stream."""
-        self._updated_by = TeslemetryUpdateType.STREAMING
-        self._updated_at = data["timestamp"]
+        if (
+            self._stream_confirms_commands
+            or self._updated_by != TeslemetryUpdateType.COMMAND
+        ):
+            # The stream confirms a commanded value straight away
+            self._updated_by = TeslemetryUpdateType.STREAMING
+            self._updated_at = data["timestamp"]
         self._async_value_from_stream(data["data"][self.streaming_key])
-        self._attr_extra_state_attributes = {
-            "updated_by": self._updated_by.value,
-            "updated_at": dt_util.utc_from_timestamp(self._updated_at / 1000),
-        }
-        self.async_write_ha_state()
+        self._async_update_extra_attrs()
+        self.async_write_coalesced()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        timestamp = (
-            self.timestamp_key and self.get(self.timestamp_key) or int(time() * 1000)
-        )
-        if (
-            self._updated_by != TeslemetryUpdateType.STREAMING
-            and timestamp > self._updated_at
-            or timestamp > (self._updated_at + STREAMING_GAP)
-        ):
+        now = int(time() * 1000)
+        polled_at = self.timestamp_key and self.get(self.timestamp_key)
+        timestamp = polled_at or now
+        if self._updated_by == TeslemetryUpdateType.COMMAND:
+            # Keep the commanded value until the vehicle reports data from
+            # after the command, or the reconciliation window ends
+            update = (polled_at or 0) > self._updated_at or now > (
+                self._updated_at + self.coordinator.streaming_gap
+            )
+        else:
+            update = (
+                self._updated_by != TeslemetryUpdateType.STREAMING
+                and timestamp > self._updated_at
+                or timestamp > (self._updated_at + self.coordinator.streaming_gap)
+            )
+        if update:
+            updated_by = self._updated_by
             self._updated_by = TeslemetryUpdateType.POLLING
             self._updated_at = timestamp
             self._async_update_attrs()
-            self._attr_extra_state_attributes = {
-                "updated_by": self._updated_by.value,
-                "updated_at": dt_util.utc_from_timestamp(self._updated_at / 1000),
-            }
-            self.async_write_ha_state()
+            if updated_by != self._updated_by or self._async_state_changed():
+                self._async_update_extra_attrs()
+                self.async_write_ha_state()
+
+    def _async_update_extra_attrs(self) -> None:
+        """Update the extra attributes describing the source of the state."""
+        self._attr_extra_state_attributes = {
+            "updated_by": self._updated_by.value,
+            "updated_at": dt_util.utc_from_timestamp(self._updated_at / 1000),
+        }
 
     async def wake_up_if_asleep(self) -> None:
         """Wake up the vehicle if its asleep."""
         await wake_up_vehicle(self)
 
-    async def handle_command(self, command) -> dict[str, Any]:
-        """Handle a vehicle command."""
-        return await handle_vehicle_command(command)
+    async def handle_command(
+        self, command, current: Any = None, target: Any = None
+    ) -> dict[str, Any]:
+        """Queue a vehicle command, waking the vehicle if required.
+
+        Stream and polling updates are applied in timestamp order, so the
+        current value of the entity is the freshest known value, unless it
+        was set by an earlier command that has not been confirmed yet.
+
+        The entity then holds the value it sets after the command until the
+        vehicle confirms it, ignoring polled data from before the command.
+        If it is not confirmed within the streaming gap, the entity returns
+        to the polled value. A skipped command leaves the entity following
+        the vehicle.
+        """
+        sent, result = await self.commands.async_send(
+            command,
+            self.key,
+            None if self._updated_by == TeslemetryUpdateType.COMMAND else current,
+            target,
+        )
+        if not sent:
+            return result
+        self._updated_by = TeslemetryUpdateType.COMMAND
+        self._updated_at = int(time() * 1000)
+        self._async_update_extra_attrs()
+        # Coordinator updates only arrive when a key of the entity changes,
+        # so release the hold on a timer in case the vehicle never confirms
+        self._async_cancel_hold()
+        self._cancel_hold = async_call_later(
+            self.hass, self.coordinator.streaming_gap / 1000, self._async_release_hold
+        )
+        return result
+
+    @callback
+    def _async_release_hold(self, _: datetime) -> None:
+        """Return to the polled value when a command was never confirmed."""
+        self._cancel_hold = None
+        if self._updated_by != TeslemetryUpdateType.COMMAND:
+            return
+        self._updated_by = TeslemetryUpdateType.POLLING
+        self._updated_at = (
+            self.timestamp_key and self.get(self.timestamp_key)
+        ) or int(time() * 1000)
+        self._async_update_attrs()
+        self._async_update_extra_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_hold(self) -> None:
+        """Cancel the release of a commanded value."""
+        if self._cancel_hold:
+            self._cancel_hold()
+            self._cancel_hold = None
 
 
 class TeslemetryEnergyLiveEntity(TeslemetryEntity):
@@ -227,10 +447,11 @@ class TeslemetryEnergyLiveEntity(TeslemetryEntity):
         key: str,
     ) -> None:
         """Initialize common aspects of a Teslemetry Energy Site Live entity."""
+        self.api = data.api
         self._attr_unique_id = f"{data.id}-{key}"
         self._attr_device_info = data.device
 
-        super().__init__(data.live_coordinator, data.api, key)
+        super().__init__(data.live_coordinator, key)
 
 
 class TeslemetryEnergyInfoEntity(TeslemetryEntity):
@@ -242,10 +463,22 @@ class TeslemetryEnergyInfoEntity(TeslemetryEntity):
         key: str,
     ) -> None:
         """Initialize common aspects of a Teslemetry Energy Site Info entity."""
+        self.api = data.api
         self._attr_unique_id = f"{data.id}-{key}"
         self._attr_device_info = data.device
 
-        super().__init__(data.info_coordinator, data.api, key)
+        super().__init__(data.info_coordinator, key)
+
+    async def handle_command(
+        self, command, values: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Handle a command, merging the values it sets into the site info."""
+        result = await super().handle_command(command)
+        if values:
+            self.coordinator.async_merge(values)
+        # Refresh anything else the command changed, like derived settings
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
+        return result
 
 
 class TeslemetryWallConnectorEntity(
@@ -254,6 +487,7 @@ class TeslemetryWallConnectorEntity(
     """Parent class for Teslemetry Wall Connector Entities."""
 
     _attr_has_entity_name = True
+    coordinator_keys = ("wall_connectors",)
 
     def __init__(
         self,
@@ -262,6 +496,7 @@ class TeslemetryWallConnectorEntity(
         key: str,
     ) -> None:
         """Initialize common aspects of a Teslemetry entity."""
+        self.api = data.api
         self.din = din
         self._attr_unique_id = f"{data.id}-{din}-{key}"
 
@@ -277,7 +512,7 @@ class TeslemetryWallConnectorEntity(
             model=self._get_model(data)
         )
 
-        super().__init__(data.live_coordinator, data.api, key)
+        super().__init__(data.live_coordinator, key)
 
     def _get_model(self, data) -> str | None:
         """Return the model of the wall connector."""
@@ -0,0 +1,126 @@
+"""Teslemetry value filters."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from typing import Any, Self
+
+
+@dataclass(slots=True)
+class TeslemetryFilter:
+    """Base class of a stateful filter for the values of an entity.
+
+    Entity descriptions hold a template of each filter, which every entity
+    copies so the state of a filter is never shared between vehicles.
+    """
+
+    def copy(self) -> Self:
+        """Return a copy of the filter without its state."""
+        return replace(self)
+
+    def __call__(self, value: Any) -> Any:
+        """Return the filtered value."""
+        raise NotImplementedError
+
+
+@dataclass(slots=True)
+class IgnoreDrop(TeslemetryFilter):
+    """Keep the last value unless it rises, or drops by more than change."""
+
+    change: float = 1
+    _last: float | None = field(default=None, init=False, repr=False)
+
+    def __call__(self, value: float) -> float:
+        """Return the value, ignoring small drops."""
+        last = self._last
+        if last is None or value > last or last - value > self.change:
+            self._last = value
+            return value
+        return last
+
+
+@dataclass(slots=True)
+class Hysteresis(TeslemetryFilter):
+    """Switch on at or above high and off at or below low."""
+
+    low: float
+    high: float
+    _on: bool | None = field(default=None, init=False, repr=False)
+
+    def __call__(self, value: float) -> bool:
+        """Return if the value is on, keeping the last state between the bounds."""
+        if value >= self.high:
+            self._on = True
+        elif value <= self.low:
+            self._on = False
+        elif self._on is None:
+            self._on = value >= (self.low + self.high) / 2
+        return self._on
+
+
+@dataclass(slots=True)
+class VarianceGate(TeslemetryFilter):
+    """Keep the last value until it changes by at least variance."""
+
+    variance: float
+    _last: float | None = field(default=None, init=False, repr=False)
+
+    def __call__(self, value: float) -> float:
+        """Return the value once it has moved far enough."""
+        last = self._last
+        if last is None or abs(value - last) >= self.variance:
+            self._last = value
+            return value
+        return last
+
+
+@dataclass(slots=True)
+class Deadband(TeslemetryFilter):
+    """Keep the last value until it moves beyond an absolute or percent band."""
+
+    absolute: float = 0
+    percent: float = 0
+    _last: float | None = field(default=None, init=False, repr=False)
+
+    def __call__(self, value: Any) -> Any:
+        """Return the value once it has left the band around the last value."""
+        if not isinstance(value, int | float):
+            return value
+        last = self._last
+        if last is None or abs(value - last) > max(
+            self.absolute, abs(last) * self.percent / 100
+        ):
+            self._last = value
+            return value
+        return last
+
+
+@dataclass(slots=True)
+class EMA(TeslemetryFilter):
+    """Smooth values with an exponential moving average."""
+
+    alpha: float
+    _average: float | None = field(default=None, init=False, repr=False)
+
+    def __call__(self, value: float) -> float:
+        """Return the average including the value."""
+        if self._average is None:
+            self._average = value
+        else:
+            self._average += self.alpha * (value - self._average)
+        return self._average
+
+
+def copy_filters(filters: Iterable[TeslemetryFilter]) -> tuple[TeslemetryFilter, ...]:
+    """Return copies of filter templates for a single entity."""
+    return tuple(value_filter.copy() for value_filter in filters)
+
+
+def apply_filters(filters: tuple[TeslemetryFilter, ...], value: Any) -> Any:
+    """Pass a value through each filter in order, leaving None unfiltered."""
+    for value_filter in filters:
+        if value is None:
+            return None
+        value = value_filter(value)
+    return value
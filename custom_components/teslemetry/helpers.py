@@ -1,33 +1,219 @@
 """Teslemetry helper functions."""
 
 import asyncio
+from collections.abc import Coroutine
+import re
+import sys
 from typing import Any
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import entity_registry as er
+from tesla_fleet_api import VehicleSpecific
 from tesla_fleet_api.exceptions import TeslaFleetError
-from .const import LOGGER, TeslemetryState
+from .const import LOGGER, TeslemetryPriority, TeslemetryState
+from .coordinator import TeslemetryVehicleDataCoordinator
 
+WAKE_TIMEOUT = 30
+COMMAND_WINDOW = 0.1
+COMMAND_CONCURRENCY = 3
 
-async def wake_up_vehicle(vehicle):
-    """Wake up a vehicle."""
-    async with vehicle.wakelock:
+
+class TeslemetryWakeUpManager:
+    """Wake up a vehicle, sharing a single attempt between callers."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: VehicleSpecific,
+        coordinator: TeslemetryVehicleDataCoordinator,
+    ) -> None:
+        """Initialize the wake up manager."""
+        self.hass = hass
+        self.api = api
+        self.coordinator = coordinator
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def online(self) -> bool:
+        """Return if the vehicle is online."""
+        return self.coordinator.data["state"] == TeslemetryState.ONLINE
+
+    async def async_wake_up(self) -> None:
+        """Wake up the vehicle if it is not online."""
+        if self.online:
+            return
+        async with self._lock:
+            if self._task is None or self._task.done():
+                if self.online:
+                    return
+                self._task = self.hass.async_create_task(self._async_wake_up())
+            task = self._task
+        # Shield the shared attempt from callers that are cancelled
+        await asyncio.shield(task)
+
+    async def _async_wake_up(self) -> None:
+        """Send a wake up and wait for the vehicle to come online.
+
+        The vehicle is online as soon as it sends a stream message, or when
+        polling reports it online, whichever comes first.
+        """
+        state = await self._async_call(self.api.wake_up())
+        if state == TeslemetryState.ONLINE:
+            return
+        waiters = (
+            self.coordinator.dispatcher.async_next_message(),
+            self.hass.async_create_task(self._async_poll()),
+        )
+        try:
+            done, _ = await asyncio.wait(
+                waiters, timeout=WAKE_TIMEOUT, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        if not done:
+            raise HomeAssistantError("Could not wake up vehicle")
+        for waiter in done:
+            # Raise any error from polling
+            waiter.result()
+        self.coordinator.data["state"] = TeslemetryState.ONLINE
+
+    async def _async_poll(self) -> None:
+        """Poll the vehicle state with a back off until it is online."""
         times = 0
-        while vehicle.coordinator.data["state"] != TeslemetryState.ONLINE:
+        while True:
+            times += 1
+            await asyncio.sleep(times * 5)
+            if await self._async_call(self.api.vehicle()) == TeslemetryState.ONLINE:
+                return
+
+    async def _async_call(self, command) -> str:
+        """Call the API and store the vehicle state it returns."""
+        try:
+            state = (
+                await self.coordinator.scheduler.async_call(
+                    TeslemetryPriority.WAKE, command
+                )
+            )["response"]["state"]
+        except TeslaFleetError as e:
+            raise HomeAssistantError(str(e)) from e
+        except TypeError as e:
+            raise HomeAssistantError("Invalid response from Teslemetry") from e
+        self.coordinator.data["state"] = state
+        return state
+
+
+class TeslemetryCommandQueue:
+    """Batch commands to a vehicle so they share a single wake up."""
+
+    def __init__(
+        self, hass: HomeAssistant, wakeup: TeslemetryWakeUpManager
+    ) -> None:
+        """Initialize the command queue."""
+        self.hass = hass
+        self.wakeup = wakeup
+        self._pending: list[tuple[Coroutine, asyncio.Future[Any]]] = []
+        self._inflight: dict[tuple[str, str, Any], asyncio.Future[Any]] = {}
+        self._semaphore = asyncio.Semaphore(COMMAND_CONCURRENCY)
+
+    async def async_send(
+        self,
+        command: Coroutine,
+        key: str | None = None,
+        current: Any = None,
+        target: Any = None,
+    ) -> tuple[bool, Any]:
+        """Queue a command for the vehicle and return if it was sent and its result.
+
+        When the key and target of an idempotent command are provided, the
+        command is skipped if the current value already matches the target,
+        and an identical command that is still in flight is shared.
+        """
+        ident = None
+        if key is not None and target is not None:
+            if current == target:
+                LOGGER.debug(
+                    "Skipping %s, %s is already %s", command.__qualname__, key, target
+                )
+                command.close()
+                return False, None
+            ident = (key, command.__qualname__, target)
+            if (inflight := self._inflight.get(ident)) is not None:
+                LOGGER.debug(
+                    "Sharing in flight %s for %s", command.__qualname__, key
+                )
+                command.close()
+                return True, await asyncio.shield(inflight)
+        future: asyncio.Future[Any] = self.hass.loop.create_future()
+        if ident is not None:
+            self._inflight[ident] = future
+            future.add_done_callback(lambda _: self._inflight.pop(ident, None))
+        if not self._pending:
+            self.hass.async_create_task(self._async_process())
+        self._pending.append((command, future))
+        return True, await future
+
+    async def _async_process(self) -> None:
+        """Wake the vehicle once and send every command in the window."""
+        await asyncio.sleep(COMMAND_WINDOW)
+        batch, self._pending = self._pending, []
+        try:
+            await self.wakeup.async_wake_up()
+        except HomeAssistantError as e:
+            for command, future in batch:
+                command.close()
+                if not future.done():
+                    future.set_exception(e)
+            return
+        await asyncio.gather(
+            *(self._async_send(command, future) for command, future in batch)
+        )
+
+    async def _async_send(self, command: Coroutine, future: asyncio.Future[Any]) -> None:
+        """Send a single command and resolve its caller."""
+        if future.done():
+            # The caller is no longer waiting
+            command.close()
+            return
+        async with self._semaphore:
             try:
-                if times == 0:
-                    cmd = await vehicle.api.wake_up()
-                else:
-                    cmd = await vehicle.api.vehicle()
-                state = cmd["response"]["state"]
-            except TeslaFleetError as e:
-                raise HomeAssistantError(str(e)) from e
-            except TypeError as e:
-                raise HomeAssistantError("Invalid response from Teslemetry") from e
-            vehicle.coordinator.data["state"] = state
-            if state != TeslemetryState.ONLINE:
-                times += 1
-                if times >= 4:  # Give up after 30 seconds total
-                    raise HomeAssistantError("Could not wake up vehicle")
-                await asyncio.sleep(times * 5)
+                result = await handle_vehicle_command(
+                    self.wakeup.coordinator.scheduler.async_call(
+                        TeslemetryPriority.COMMAND, command
+                    )
+                )
+            except Exception as e:  # noqa: BLE001
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+
+@callback
+def async_disabled_unique_ids(
+    hass: HomeAssistant, entry: ConfigEntry, domain: str
+) -> set[str]:
+    """Return the unique IDs of entities of a platform disabled in the registry.
+
+    Disabled entities are not created, and Home Assistant reloads the config
+    entry when one is enabled. Entities that are not registered yet are still
+    created, so their registry entry gets its default disabled state.
+    """
+    return {
+        entity.unique_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if entity.domain == domain and entity.disabled
+    }
+
+
+async def wake_up_vehicle(vehicle) -> None:
+    """Wake up a vehicle."""
+    await vehicle.wakeup.async_wake_up()
 
 
 async def handle_command(command) -> dict[str, Any]:
@@ -77,19 +263,55 @@ def auto_type(str):
     return str
 
 
-def ignore_drop(change: int | float = 1):
-    """Ignore a drop in value."""
-    _last_value = None
+_INTEGER = re.compile(r"\d+").fullmatch
+_FLOAT = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?").fullmatch
+_BOOLEANS = {"true": True, "false": False}
+
+
+def decode_passthrough(value: Any) -> Any:
+    """Return a streaming value unchanged."""
+    return value
+
+
+def decode_int(value: Any) -> int:
+    """Decode an integer streaming value."""
+    return int(value)
+
+
+def decode_float(value: Any) -> float:
+    """Decode a numeric streaming value."""
+    return float(value)
+
+
+def decode_bool(value: Any) -> bool | None:
+    """Decode a boolean streaming value."""
+    if isinstance(value, bool):
+        return value
+    return _BOOLEANS.get(value.lower())
+
+
+def decode_enum(value: Any) -> Any:
+    """Decode an enumerated streaming value, sharing one copy of each name."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def decode_location(value: Any) -> dict[str, float]:
+    """Decode a location streaming value."""
+    return {
+        "latitude": float(value["latitude"]),
+        "longitude": float(value["longitude"]),
+    }
 
-    def _ignore_drop(value):
-        try:
-            value = float(value)
-        except ValueError:
-            return None
 
-        nonlocal _last_value, change
-        if _last_value is None or value > _last_value or (_last_value - value) > change:
-            _last_value = value
-        return _last_value
+def decode_auto(value: Any) -> Any:
+    """Decode a streaming value of unknown type, like auto_type."""
+    if not isinstance(value, str):
+        return value
+    if _INTEGER(value):
+        return int(value)
+    if _FLOAT(value):
+        return float(value)
+    if len(value) <= 5 and (boolean := _BOOLEANS.get(value.lower())) is not None:
+        return boolean
+    return value
 
-    return _ignore_drop
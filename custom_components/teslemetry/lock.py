@@ -16,6 +16,7 @@ from .const import DOMAIN, TeslemetryChargeCableLockStates, TeslemetryTimestamp
 from .entity import (
     TeslemetryVehicleEntity,
 )
+from .helpers import decode_bool, decode_enum
 from .models import TeslemetryVehicleData
 
 
@@ -39,6 +40,8 @@ async def async_setup_entry(
 class TeslemetryVehicleLockEntity(TeslemetryVehicleEntity, LockEntity):
     """Lock entity for Teslemetry."""
 
+    streaming_decoder = staticmethod(decode_bool)
+
     def __init__(self, data: TeslemetryVehicleData, scoped: bool) -> None:
         """Initialize the sensor."""
         super().__init__(
@@ -60,16 +63,16 @@ class TeslemetryVehicleLockEntity(TeslemetryVehicleEntity, LockEntity):
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the doors."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.door_lock())
+        await self.handle_command(self.api.door_lock(), self._attr_is_locked, True)
         self._attr_is_locked = True
         self.async_write_ha_state()
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the doors."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.door_unlock())
+        await self.handle_command(
+            self.api.door_unlock(), self._attr_is_locked, False
+        )
         self._attr_is_locked = False
         self.async_write_ha_state()
 
@@ -77,6 +80,8 @@ class TeslemetryVehicleLockEntity(TeslemetryVehicleEntity, LockEntity):
 class TeslemetryCableLockEntity(TeslemetryVehicleEntity, LockEntity):
     """Cable Lock entity for Teslemetry."""
 
+    streaming_decoder = staticmethod(decode_enum)
+
     def __init__(
         self,
         data: TeslemetryVehicleData,
@@ -112,8 +117,9 @@ class TeslemetryCableLockEntity(TeslemetryVehicleEntity, LockEntity):
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock charge cable lock."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.charge_port_door_open())
+        await self.handle_command(
+            self.api.charge_port_door_open(), self._attr_is_locked, False
+        )
         self._attr_is_locked = False
         self.async_write_ha_state()
 
@@ -121,6 +127,7 @@ class TeslemetryCableLockEntity(TeslemetryVehicleEntity, LockEntity):
 class TeslemetrySpeedLimitEntity(TeslemetryVehicleEntity, LockEntity):
     """Speed Limit with PIN entity for Tessie."""
 
+    streaming_decoder = staticmethod(decode_bool)
     _attr_code_format = r"^\d\d\d\d$"
 
     def __init__(
@@ -136,13 +143,18 @@ class TeslemetrySpeedLimitEntity(TeslemetryVehicleEntity, LockEntity):
         """Update entity attributes."""
         self._attr_is_locked = self._value
 
+    def _async_value_from_stream(self, value) -> None:
+        """Update entity value from stream."""
+        self._attr_is_locked = value
+
     async def async_lock(self, **kwargs: Any) -> None:
         """Enable speed limit with pin."""
         code: str | None = kwargs.get(ATTR_CODE)
         if code:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.speed_limit_activate(code))
+            await self.handle_command(
+                self.api.speed_limit_activate(code), self._attr_is_locked, True
+            )
             self._attr_is_locked = True
             self.async_write_ha_state()
 
@@ -151,8 +163,9 @@ class TeslemetrySpeedLimitEntity(TeslemetryVehicleEntity, LockEntity):
         code: str | None = kwargs.get(ATTR_CODE)
         if code:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.speed_limit_deactivate(code))
+            await self.handle_command(
+                self.api.speed_limit_deactivate(code), self._attr_is_locked, False
+            )
 
             self._attr_is_locked = False
             self.async_write_ha_state()
@@ -42,6 +42,20 @@ async def async_setup_entry(
 class TeslemetryMediaEntity(TeslemetryVehicleEntity, MediaPlayerEntity):
     """Vehicle Location Media Class."""
 
+    coordinator_keys = (
+        "vehicle_state_media_info_audio_volume",
+        "vehicle_state_media_info_audio_volume_increment",
+        "vehicle_state_media_info_audio_volume_max",
+        "vehicle_state_media_info_media_playback_status",
+        "vehicle_state_media_info_now_playing_album",
+        "vehicle_state_media_info_now_playing_artist",
+        "vehicle_state_media_info_now_playing_duration",
+        "vehicle_state_media_info_now_playing_elapsed",
+        "vehicle_state_media_info_now_playing_source",
+        "vehicle_state_media_info_now_playing_station",
+        "vehicle_state_media_info_now_playing_title",
+    )
+
     _attr_device_class = MediaPlayerDeviceClass.SPEAKER
     _attr_supported_features = (
         MediaPlayerEntityFeature.NEXT_TRACK
@@ -105,8 +119,11 @@ class TeslemetryMediaEntity(TeslemetryVehicleEntity, MediaPlayerEntity):
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.adjust_volume(int(volume * self.max_volume)))
+        await self.handle_command(
+            self.api.adjust_volume(int(volume * self.max_volume)),
+            self._attr_volume_level,
+            volume,
+        )
         self._attr_volume_level = volume
         self.async_write_ha_state()
 
@@ -114,8 +131,11 @@ class TeslemetryMediaEntity(TeslemetryVehicleEntity, MediaPlayerEntity):
         """Send play command."""
         if self.state != MediaPlayerState.PLAYING:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.media_toggle_playback())
+            await self.handle_command(
+                self.api.media_toggle_playback(),
+                self._attr_state,
+                MediaPlayerState.PLAYING,
+            )
             self._attr_state = MediaPlayerState.PLAYING
             self.async_write_ha_state()
 
@@ -123,19 +143,20 @@ class TeslemetryMediaEntity(TeslemetryVehicleEntity, MediaPlayerEntity):
         """Send pause command."""
         if self.state == MediaPlayerState.PLAYING:
             self.raise_for_scope()
-            await self.wake_up_if_asleep()
-            await self.handle_command(self.api.media_toggle_playback())
+            await self.handle_command(
+                self.api.media_toggle_playback(),
+                self._attr_state,
+                MediaPlayerState.PAUSED,
+            )
             self._attr_state = MediaPlayerState.PAUSED
             self.async_write_ha_state()
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         await self.handle_command(self.api.media_next_track())
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         await self.handle_command(self.api.media_prev_track())
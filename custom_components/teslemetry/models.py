@@ -3,8 +3,9 @@
 from __future__ import annotations
 from homeassistant.util import dt as dt_util
 
-import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import aiohttp
 
 from tesla_fleet_api import EnergySpecific, VehicleSpecific
 from tesla_fleet_api.const import Scope
@@ -18,6 +19,10 @@ from .coordinator import (
     TeslemetryEnergySiteLiveCoordinator,
     TeslemetryVehicleDataCoordinator,
 )
+from .helpers import TeslemetryCommandQueue, TeslemetryWakeUpManager
+from .scheduler import TeslemetryScheduler
+from .snapshot import TeslemetrySnapshot
+from .stream import TeslemetryStreamDispatcher
 
 
 @dataclass
@@ -27,6 +32,9 @@ class TeslemetryData:
     vehicles: list[TeslemetryVehicleData]
     energysites: list[TeslemetryEnergyData]
     scopes: list[Scope]
+    snapshot: TeslemetrySnapshot
+    session: aiohttp.ClientSession
+    scheduler: TeslemetryScheduler
 
 
 @dataclass
@@ -36,10 +44,15 @@ class TeslemetryVehicleData:
     api: VehicleSpecific
     coordinator: TeslemetryVehicleDataCoordinator
     stream: TeslemetryStream
+    dispatcher: TeslemetryStreamDispatcher
     remove_listeners: tuple[callable]
     vin: str
     device: DeviceInfo
-    wakelock = asyncio.Lock()
+    wakeup: TeslemetryWakeUpManager
+    commands: TeslemetryCommandQueue
+    write_interval: float = 0
+    # Deadband and max rate overrides of each streaming field
+    stream_filters: dict[str, dict[str, float]] = field(default_factory=dict)
     last_alert: str = dt_util.utcnow().isoformat()
     last_error: str = dt_util.utcnow().isoformat()
 
@@ -31,6 +31,7 @@ from .entity import (
     TeslemetryVehicleEntity,
     TeslemetryEnergyInfoEntity,
 )
+from .helpers import decode_float
 from .models import TeslemetryVehicleData, TeslemetryEnergyData
 
 
@@ -154,6 +155,7 @@ async def async_setup_entry(
 class TeslemetryVehicleNumberEntity(TeslemetryVehicleEntity, NumberEntity):
     """Number entity for current charge."""
 
+    streaming_decoder = staticmethod(decode_float)
     entity_description: TeslemetryNumberEntityDescription
 
     def __init__(
@@ -165,6 +167,7 @@ class TeslemetryVehicleNumberEntity(TeslemetryVehicleEntity, NumberEntity):
         """Initialize the Number entity."""
         self.scoped = any(scope in scopes for scope in description.scopes)
         self.entity_description = description
+        self.coordinator_keys = (description.min_key, description.max_key)
         super().__init__(
             data, description.key, description.timestamp_key, description.streaming_key
         )
@@ -189,14 +192,23 @@ class TeslemetryVehicleNumberEntity(TeslemetryVehicleEntity, NumberEntity):
         """Set new value."""
         value = int(value)
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.entity_description.func(self.api, value))
+        await self.handle_command(
+            self.entity_description.func(self.api, value),
+            self._attr_native_value,
+            value,
+        )
         self._attr_native_value = value
         self.async_write_ha_state()
 
 class TeslemetryImperialSpeedNumberEntity(TeslemetryVehicleEntity, NumberEntity):
     """Number entity for speed limit in MPH."""
 
+    streaming_decoder = staticmethod(decode_float)
+    coordinator_keys = (
+        "vehicle_state_speed_limit_mode_min_limit_mph",
+        "vehicle_state_speed_limit_mode_max_limit_mph",
+    )
+
     device_class = NumberDeviceClass.SPEED
     native_unit_of_measurement = UnitOfSpeed.MILES_PER_HOUR
     mode = NumberMode.BOX
@@ -229,13 +241,14 @@ class TeslemetryImperialSpeedNumberEntity(TeslemetryVehicleEntity, NumberEntity)
 
     def _async_value_from_stream(self, value) -> None:
         """Update the value of the entity."""
-        self._attr_native_value = float(value)
+        self._attr_native_value = value
 
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.api.speed_limit_set_limit(value))
+        await self.handle_command(
+            self.api.speed_limit_set_limit(value), self._attr_native_value, value
+        )
         self._attr_native_value = value
         self.async_write_ha_state()
 
@@ -243,6 +256,13 @@ class TeslemetryImperialSpeedNumberEntity(TeslemetryVehicleEntity, NumberEntity)
 class TeslemetryMetricSpeedNumberEntity(TeslemetryVehicleEntity, NumberEntity):
     """Number entity for speed limit in KMPH."""
 
+    streaming_decoder = staticmethod(decode_float)
+    coordinator_keys = (
+        "vehicle_state_speed_limit_mode_current_limit_mph",
+        "vehicle_state_speed_limit_mode_min_limit_mph",
+        "vehicle_state_speed_limit_mode_max_limit_mph",
+    )
+
     device_class = NumberDeviceClass.SPEED
     mode = NumberMode.BOX
     native_unit_of_measurement = UnitOfSpeed.KILOMETERS_PER_HOUR
@@ -298,9 +318,10 @@ class TeslemetryMetricSpeedNumberEntity(TeslemetryVehicleEntity, NumberEntity):
     async def async_set_native_value(self, value: float) -> None:
         """Set new value."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         await self.handle_command(
-            self.api.speed_limit_set_limit(round(self.convert_from(value), 4))
+            self.api.speed_limit_set_limit(round(self.convert_from(value), 4)),
+            self._attr_native_value,
+            value,
         )
         self._attr_native_value = value
         self.async_write_ha_state()
@@ -320,6 +341,7 @@ class TeslemetryEnergyInfoNumberSensorEntity(TeslemetryEnergyInfoEntity, NumberE
         """Initialize the Number entity."""
         self.scoped = any(scope in scopes for scope in description.scopes)
         self.entity_description = description
+        self.coordinator_keys = (description.min_key, description.max_key)
         super().__init__(data, description.key)
 
     def _async_update_attrs(self) -> None:
@@ -339,6 +361,6 @@ class TeslemetryEnergyInfoNumberSensorEntity(TeslemetryEnergyInfoEntity, NumberE
         """Set new value."""
         value = int(value)
         self.raise_for_scope()
-        await self.handle_command(self.entity_description.func(self.api, value))
-        self._attr_native_value = value
-        self.async_write_ha_state()
+        await self.handle_command(
+            self.entity_description.func(self.api, value), {self.key: value}
+        )
@@ -0,0 +1,165 @@
+"""Teslemetry request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable
+from email.utils import parsedate_to_datetime
+from heapq import heappop, heappush
+from http import HTTPStatus
+from itertools import count
+from time import monotonic, time
+from types import SimpleNamespace
+from typing import Any, TypeVar
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import LOGGER, TeslemetryPriority
+
+_T = TypeVar("_T")
+
+# Matches the limiter that tesla_fleet_api applies to every request, so
+# requests released by the scheduler are not held up again by the library
+RATE_LIMIT = 5
+RATE_PERIOD = 10
+# Tokens that only commands and wake ups may use
+PRIORITY_RESERVE = 2
+RETRY_AFTER_DEFAULT = 60
+
+
+class TeslemetryScheduler:
+    """Release the API requests of a config entry by priority.
+
+    Requests take a token from a bucket that refills at the rate limit of
+    the API. The waiting request with the highest priority is released
+    first, and polling leaves some tokens for commands and wake ups, so
+    they are sent promptly while every vehicle is being polled.
+
+    When the API responds with too many requests, polling is deferred
+    until the time it asked for, while commands and wake ups continue.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: int = RATE_LIMIT,
+        period: float = RATE_PERIOD,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._capacity = float(rate)
+        self._rate = rate / period
+        self._tokens = self._capacity
+        self._refilled_at = monotonic()
+        self._queue: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = count()
+        self._deferred_until = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_end.append(self._async_on_request_end)
+
+    async def async_call(self, priority: TeslemetryPriority, target: Awaitable[_T]) -> _T:
+        """Wait for a token and then await the request."""
+        try:
+            await self._async_acquire(priority)
+        except BaseException:
+            if asyncio.iscoroutine(target):
+                target.close()
+            raise
+        return await target
+
+    async def _async_acquire(self, priority: TeslemetryPriority) -> None:
+        """Wait until the request is released."""
+        future: asyncio.Future[None] = self.hass.loop.create_future()
+        heappush(self._queue, (priority, next(self._order), future))
+        self._async_release()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Released just before the caller gave up
+                self._tokens += 1
+            future.cancel()
+            self._async_release()
+            raise
+
+    @callback
+    def _async_release(self) -> None:
+        """Release waiting requests while there are tokens for them."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        now = monotonic()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._refilled_at) * self._rate
+        )
+        self._refilled_at = now
+        while self._queue:
+            priority, _, future = self._queue[0]
+            if future.done():
+                heappop(self._queue)
+                continue
+            if priority < TeslemetryPriority.POLL:
+                needed = 1.0
+            elif now < self._deferred_until:
+                delay = self._deferred_until - now
+                break
+            else:
+                needed = 1.0 + PRIORITY_RESERVE
+            if self._tokens < needed:
+                delay = (needed - self._tokens) / self._rate
+                break
+            self._tokens -= 1
+            heappop(self._queue)
+            future.set_result(None)
+        else:
+            return
+        self._timer = self.hass.loop.call_later(delay, self._async_release)
+
+    @callback
+    def async_defer(self, seconds: float) -> None:
+        """Defer polling after the API asked to slow down."""
+        deferred_until = monotonic() + seconds
+        if deferred_until > self._deferred_until:
+            LOGGER.warning("Teslemetry rate limited, deferring polling for %ss", seconds)
+            self._deferred_until = deferred_until
+        self._async_release()
+
+    async def _async_on_request_end(
+        self,
+        session: aiohttp.ClientSession,
+        context: SimpleNamespace,
+        params: aiohttp.TraceRequestEndParams,
+    ) -> None:
+        """Defer polling when a response is rate limited."""
+        if params.response.status == HTTPStatus.TOO_MANY_REQUESTS:
+            self.async_defer(
+                retry_after(params.response.headers.get(aiohttp.hdrs.RETRY_AFTER))
+            )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return the state of the scheduler for diagnostics."""
+        waiting = [priority for priority, _, future in self._queue if not future.done()]
+        return {
+            "tokens": round(self._tokens, 2),
+            "deferred": max(0.0, round(self._deferred_until - monotonic(), 1)),
+            "waiting": {
+                priority.name.lower(): waiting.count(priority)
+                for priority in TeslemetryPriority
+            },
+        }
+
+
+def retry_after(value: str | None) -> float:
+    """Return the seconds to wait from a Retry-After header."""
+    if value:
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time())
+        except (TypeError, ValueError):
+            pass
+    return RETRY_AFTER_DEFAULT
@@ -22,6 +22,7 @@ from .entity import (
     TeslemetryVehicleEntity,
     TeslemetryEnergyInfoEntity,
 )
+from .helpers import decode_enum
 from .models import TeslemetryEnergyData, TeslemetryVehicleData
 
 
@@ -134,6 +135,12 @@ async def async_setup_entry(
 class TeslemetrySeatHeaterSelectEntity(TeslemetryVehicleEntity, SelectEntity):
     """Select entity for vehicle seat heater."""
 
+    streaming_decoder = staticmethod(decode_enum)
+    coordinator_keys = (
+        "vehicle_config_rear_seat_heaters",
+        "vehicle_config_third_row_seats",
+    )
+
     entity_description: SeatHeaterDescription
 
     _attr_options = [
@@ -172,13 +179,14 @@ class TeslemetrySeatHeaterSelectEntity(TeslemetryVehicleEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         level = self._attr_options.index(option)
         # AC must be on to turn on seat heater
         if not self.get("climate_state_is_climate_on"):
             await self.handle_command(self.api.auto_conditioning_start())
         await self.handle_command(
-            self.api.remote_seat_heater_request(self.entity_description.position, level)
+            self.api.remote_seat_heater_request(self.entity_description.position, level),
+            self._attr_current_option,
+            option,
         )
         self._attr_current_option = option
         self.async_write_ha_state()
@@ -218,13 +226,14 @@ class TeslemetryWheelHeaterSelectEntity(TeslemetryVehicleEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         level = self._attr_options.index(option)
         # AC must be on to turn on seat heater
         if not self.get("climate_state_is_climate_on"):
             await self.handle_command(self.api.auto_conditioning_start())
         await self.handle_command(
-            self.api.remote_steering_wheel_heat_level_request(level)
+            self.api.remote_steering_wheel_heat_level_request(level),
+            self._attr_current_option,
+            option,
         )
         self._attr_current_option = option
         self.async_write_ha_state()
@@ -255,9 +264,7 @@ class TeslemetryOperationSelectEntity(TeslemetryEnergyInfoEntity, SelectEntity):
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         self.raise_for_scope()
-        await self.handle_command(self.api.operation(option))
-        self._attr_current_option = option
-        self.async_write_ha_state()
+        await self.handle_command(self.api.operation(option), {self.key: option})
 
 
 class TeslemetryExportRuleSelectEntity(TeslemetryEnergyInfoEntity, SelectEntity):
@@ -286,7 +293,6 @@ class TeslemetryExportRuleSelectEntity(TeslemetryEnergyInfoEntity, SelectEntity)
         """Change the selected option."""
         self.raise_for_scope()
         await self.handle_command(
-            self.api.grid_import_export(customer_preferred_export_rule=option)
+            self.api.grid_import_export(customer_preferred_export_rule=option),
+            {self.key: option},
         )
-        self._attr_current_option = option
-        self.async_write_ha_state()
@@ -7,9 +7,10 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from itertools import chain
-from typing import cast
+from typing import Any, cast
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
@@ -29,22 +30,45 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.variance import ignore_variance
 
-from .const import DOMAIN, TeslemetryTimestamp, MODELS
+from .const import (
+    CONF_DEADBAND,
+    CONF_DEADBAND_PERCENT,
+    CONF_MAX_RATE,
+    DOMAIN,
+    STREAM_FILTER_DEFAULTS,
+    TeslemetryTimestamp,
+    MODELS,
+)
 from .entity import (
     TeslemetryEnergyInfoEntity,
     TeslemetryEnergyLiveEntity,
+    TeslemetryVehicleContext,
     TeslemetryVehicleEntity,
     TeslemetryVehicleStreamEntity,
     TeslemetryWallConnectorEntity,
 )
 from .models import TeslemetryEnergyData, TeslemetryVehicleData
-from .helpers import auto_type, ignore_drop
+from .helpers import (
+    async_disabled_unique_ids,
+    decode_auto,
+    decode_enum,
+    decode_float,
+    decode_int,
+    decode_passthrough,
+)
+from .filters import (
+    Deadband,
+    IgnoreDrop,
+    TeslemetryFilter,
+    apply_filters,
+    copy_filters,
+)
 
 ChargeStates = {
     "Starting": "starting",
@@ -81,13 +105,16 @@ class TeslemetrySensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[StateType], StateType | datetime] = lambda x: x
     available_fn: Callable[[StateType], StateType | datetime] = lambda x: x is not None
     streaming_key: TelemetryField | None = None
+    streaming_decoder: Callable[[Any], Any] = decode_auto
     timestamp_key: TeslemetryTimestamp | None = None
+    filters: tuple[TeslemetryFilter, ...] = ()
 
 
 VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_charging_state",
         streaming_key=TelemetryField.CHARGE_STATE,
+        streaming_decoder=decode_enum,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         options=list(set(ChargeStates.values())),
         device_class=SensorDeviceClass.ENUM,
@@ -96,6 +123,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_battery_level",
         streaming_key=TelemetryField.BATTERY_LEVEL,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
@@ -114,16 +142,18 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_charge_energy_added",
         streaming_key=TelemetryField.AC_CHARGING_ENERGY_IN,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         suggested_display_precision=1,
-        value_fn=ignore_drop(),
+        filters=(IgnoreDrop(),),
     ),
     TeslemetrySensorEntityDescription(
         key="charge_state_charger_power",
         streaming_key=TelemetryField.AC_CHARGING_POWER,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPower.KILO_WATT,
@@ -141,6 +171,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_charger_actual_current",
         streaming_key=TelemetryField.CHARGE_AMPS,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
@@ -178,6 +209,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_est_battery_range",
         streaming_key=TelemetryField.EST_BATTERY_RANGE,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfLength.MILES,
@@ -188,6 +220,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_ideal_battery_range",
         streaming_key=TelemetryField.IDEAL_BATTERY_RANGE,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfLength.MILES,
@@ -198,6 +231,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="drive_state_speed",
         streaming_key=TelemetryField.VEHICLE_SPEED,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.DRIVE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfSpeed.MILES_PER_HOUR,
@@ -218,6 +252,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="drive_state_shift_state",
         streaming_key=TelemetryField.GEAR,
+        streaming_decoder=decode_enum,
         timestamp_key=TeslemetryTimestamp.DRIVE_STATE,
         options=list(ShiftStates.values()),
         device_class=SensorDeviceClass.ENUM,
@@ -228,6 +263,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_odometer",
         streaming_key=TelemetryField.ODOMETER,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfLength.MILES,
@@ -239,6 +275,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_pressure_fl",
         streaming_key=TelemetryField.TPMS_PRESSURE_FL,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
@@ -251,6 +288,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_pressure_fr",
         streaming_key=TelemetryField.TPMS_PRESSURE_FR,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
@@ -263,6 +301,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_pressure_rl",
         streaming_key=TelemetryField.TPMS_PRESSURE_RL,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
@@ -275,6 +314,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_pressure_rr",
         streaming_key=TelemetryField.TPMS_PRESSURE_RR,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
@@ -287,6 +327,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="climate_state_inside_temp",
         streaming_key=TelemetryField.INSIDE_TEMP,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CLIMATE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -296,6 +337,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="climate_state_outside_temp",
         streaming_key=TelemetryField.OUTSIDE_TEMP,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CLIMATE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
@@ -342,6 +384,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="drive_state_active_route_miles_to_arrival",
         streaming_key=TelemetryField.MILES_TO_ARRIVAL,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.DRIVE_STATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfLength.MILES,
@@ -351,6 +394,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
         # This entity isnt allowed in core
         key="charge_state_minutes_to_full_charge",
         streaming_key=TelemetryField.TIME_TO_FULL_CHARGE,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.MINUTES,
@@ -361,6 +405,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
         # This entity isnt allowed in core
         key="drive_state_active_route_minutes_to_arrival",
         streaming_key=TelemetryField.MINUTES_TO_ARRIVAL,
+        streaming_decoder=decode_float,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         device_class=SensorDeviceClass.DURATION,
         native_unit_of_measurement=UnitOfTime.MINUTES,
@@ -368,6 +413,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_last_seen_pressure_time_fl",
         streaming_key=TelemetryField.TPMS_LAST_SEEN_PRESSURE_TIME_FL,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda x: dt_util.utc_from_timestamp(int(x)),
@@ -376,6 +422,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_last_seen_pressure_time_fr",
         streaming_key=TelemetryField.TPMS_LAST_SEEN_PRESSURE_TIME_FR,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda x: dt_util.utc_from_timestamp(int(x)),
@@ -384,6 +431,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_last_seen_pressure_time_rl",
         streaming_key=TelemetryField.TPMS_LAST_SEEN_PRESSURE_TIME_RL,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda x: dt_util.utc_from_timestamp(int(x)),
@@ -392,6 +440,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_state_tpms_last_seen_pressure_time_rr",
         streaming_key=TelemetryField.TPMS_LAST_SEEN_PRESSURE_TIME_RR,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.VEHICLE_STATE,
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda x: dt_util.utc_from_timestamp(int(x)),
@@ -400,18 +449,21 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_config_roof_color",
         streaming_key=TelemetryField.ROOF_COLOR,
+        streaming_decoder=decode_enum,
         timestamp_key=TeslemetryTimestamp.VEHICLE_CONFIG,
         entity_registry_enabled_default=False,
     ),
     TeslemetrySensorEntityDescription(
         key="charge_state_scheduled_charging_mode",
         streaming_key=TelemetryField.SCHEDULED_CHARGING_MODE,
+        streaming_decoder=decode_enum,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         entity_registry_enabled_default=False,
     ),
     TeslemetrySensorEntityDescription(
         key="charge_state_scheduled_charging_start_time",
         streaming_key=TelemetryField.SCHEDULED_CHARGING_START_TIME,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda x: dt_util.utc_from_timestamp(int(x)),
@@ -420,6 +472,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="charge_state_scheduled_departure_time",
         streaming_key=TelemetryField.SCHEDULED_DEPARTURE_TIME,
+        streaming_decoder=decode_int,
         timestamp_key=TeslemetryTimestamp.CHARGE_STATE,
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda x: dt_util.utc_from_timestamp(int(x)),
@@ -428,6 +481,7 @@ VEHICLE_DESCRIPTIONS: tuple[TeslemetrySensorEntityDescription, ...] = (
     TeslemetrySensorEntityDescription(
         key="vehicle_config_exterior_color",
         streaming_key=TelemetryField.EXTERIOR_COLOR,
+        streaming_decoder=decode_enum,
         timestamp_key=TeslemetryTimestamp.VEHICLE_CONFIG,
         entity_registry_enabled_default=False,
     ),
@@ -464,14 +518,16 @@ VEHICLE_TIME_DESCRIPTIONS: tuple[TeslemetryTimeEntityDescription, ...] = (
 class TeslemetryStreamSensorEntityDescription(SensorEntityDescription):
     """Describes Teslemetry Sensor entity."""
 
-    value_fn: Callable[[StateType], StateType] = lambda x: auto_type(x)
+    value_fn: Callable[[StateType], StateType] = lambda x: x
+    streaming_decoder: Callable[[Any], Any] = decode_auto
+    filters: tuple[TeslemetryFilter, ...] = ()
 
 
 VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...] = (
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.BMS_STATE,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,
+        streaming_decoder=decode_enum,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.BRAKE_PEDAL_POS,
@@ -484,7 +540,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.BRICK_VOLTAGE_MIN,
@@ -492,24 +548,24 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.CAR_TYPE,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,
+        streaming_decoder=decode_enum,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.CHARGE_CURRENT_REQUEST_MAX,
         device_class=SensorDeviceClass.CURRENT,
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: int(x),
+        streaming_decoder=decode_int,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.CHARGE_PORT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,
+        streaming_decoder=decode_enum,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.CRUISE_FOLLOW_DISTANCE,
@@ -576,18 +632,22 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_MOTOR_CURRENT_F,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_MOTOR_CURRENT_R,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_MOTOR_CURRENT_REL,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_MOTOR_CURRENT_RER,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_SLAVE_TORQUE_CMD,
@@ -615,7 +675,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=1,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         entity_registry_enabled_default=False,
     ),
     TeslemetryStreamSensorEntityDescription(
@@ -624,7 +684,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=1,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         entity_registry_enabled_default=False,
     ),
     TeslemetryStreamSensorEntityDescription(
@@ -633,7 +693,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=1,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         entity_registry_enabled_default=False,
     ),
     TeslemetryStreamSensorEntityDescription(
@@ -642,24 +702,28 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         suggested_display_precision=1,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         entity_registry_enabled_default=False,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_TORQUE_ACTUAL_F,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_TORQUE_ACTUAL_R,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_TORQUE_ACTUAL_REL,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_TORQUE_ACTUAL_RER,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.DI_TORQUEMOTOR,
@@ -671,7 +735,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         suggested_display_precision=1,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         entity_registry_enabled_default=False,
     ),
     TeslemetryStreamSensorEntityDescription(
@@ -680,7 +744,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         device_class=SensorDeviceClass.VOLTAGE,
         suggested_display_precision=1,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         entity_registry_enabled_default=False,
     ),
     TeslemetryStreamSensorEntityDescription(
@@ -713,7 +777,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.ENERGY_REMAINING,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
@@ -750,7 +814,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.ISOLATION_RESISTANCE,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
     ),
@@ -761,6 +825,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.LATERAL_ACCELERATION,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.LIFETIME_ENERGY_GAINED_REGEN,
@@ -792,6 +857,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.LONGITUDINAL_ACCELERATION,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.MODULE_TEMP_MAX,
@@ -799,7 +865,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.MODULE_TEMP_MIN,
@@ -807,7 +873,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.NOT_ENOUGH_POWER_TO_HEAT,
@@ -816,22 +882,22 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.NUM_BRICK_VOLTAGE_MAX,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,  # Number is not a measurement
+        streaming_decoder=decode_passthrough,  # Number is not a measurement
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.NUM_BRICK_VOLTAGE_MIN,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,  # Number is not a measurement
+        streaming_decoder=decode_passthrough,  # Number is not a measurement
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.NUM_MODULE_TEMP_MAX,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,  # Number is not a measurement
+        streaming_decoder=decode_passthrough,  # Number is not a measurement
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.NUM_MODULE_TEMP_MIN,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: x,  # Number is not a measurement
+        streaming_decoder=decode_passthrough,  # Number is not a measurement
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.ORIGIN_LOCATION,
@@ -843,7 +909,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.PACK_VOLTAGE,
@@ -851,12 +917,12 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
         state_class=SensorStateClass.MEASUREMENT,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: float(x),
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.PAIRED_PHONE_KEY_AND_KEY_FOB_QTY,
         entity_registry_enabled_default=False,
-        value_fn=lambda x: int(x),
+        streaming_decoder=decode_int,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.PASSENGER_SEAT_BELT,
@@ -865,6 +931,7 @@ VEHICLE_STREAM_DESCRIPTIONS: tuple[TeslemetryStreamSensorEntityDescription, ...]
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.PEDAL_POSITION,
         entity_registry_enabled_default=False,
+        streaming_decoder=decode_float,
     ),
     TeslemetryStreamSensorEntityDescription(
         key=TelemetryField.PIN_TO_DRIVE_ENABLED,
@@ -1040,23 +1107,26 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Teslemetry sensor platform from a config entry."""
 
-
+    disabled = async_disabled_unique_ids(hass, entry, SENSOR_DOMAIN)
     async_add_entities(
         chain(
             (  # Add vehicles
                 TeslemetryVehicleSensorEntity(vehicle, description)
                 for vehicle in entry.runtime_data.vehicles
                 for description in VEHICLE_DESCRIPTIONS
+                if f"{vehicle.vin}-{description.key}" not in disabled
             ),
             (  # Add vehicles time sensors
                 TeslemetryVehicleTimeSensorEntity(vehicle, description)
                 for vehicle in entry.runtime_data.vehicles
                 for description in VEHICLE_TIME_DESCRIPTIONS
+                if f"{vehicle.vin}-{description.key}_timestamp" not in disabled
             ),
             (  # Add vehicle streaming
                 TeslemetryStreamSensorEntity(vehicle, description)
                 for vehicle in entry.runtime_data.vehicles
                 for description in VEHICLE_STREAM_DESCRIPTIONS
+                if f"{vehicle.vin}-stream_{description.key.lower()}" not in disabled
             ),
             (  # Add energy site live
                 TeslemetryEnergyLiveSensorEntity(energysite, description)
@@ -1099,6 +1169,7 @@ class TeslemetryVehicleSensorEntity(TeslemetryVehicleEntity, SensorEntity):
     """Base class for Teslemetry vehicle metric sensors."""
 
     entity_description: TeslemetrySensorEntityDescription
+    _filters: tuple[TeslemetryFilter, ...] = ()
 
     def __init__(
         self,
@@ -1107,26 +1178,37 @@ class TeslemetryVehicleSensorEntity(TeslemetryVehicleEntity, SensorEntity):
     ) -> None:
         """Initialize the sensor."""
         self.entity_description = description
+        if description.filters:
+            self._filters = copy_filters(description.filters)
         super().__init__(
             data, description.key, description.timestamp_key, description.streaming_key
         )
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the sensor."""
-        if self.coordinator.updated_once:
+        if self.coordinator.has_data:
             if self.entity_description.available_fn(self._value):
                 self._attr_available = True
-                self._attr_native_value = self.entity_description.value_fn(self._value)
+                self._attr_native_value = apply_filters(
+                    self._filters, self.entity_description.value_fn(self._value)
+                )
             else:
                 self._attr_available = False
                 self._attr_native_value = None
         else:
             self._attr_native_value = None
 
+    @property
+    def streaming_decoder(self) -> Callable[[Any], Any]:
+        """Return the decoder of the streaming key."""
+        return self.entity_description.streaming_decoder
+
     def _async_value_from_stream(self, value) -> None:
         """Update the value of the entity."""
         self._attr_available = True
-        self._attr_native_value = self.entity_description.value_fn(auto_type(value))
+        self._attr_native_value = apply_filters(
+            self._filters, self.entity_description.value_fn(value)
+        )
 
 
 class TeslemetryVehicleTimeSensorEntity(TeslemetryVehicleEntity, SensorEntity):
@@ -1134,6 +1216,7 @@ class TeslemetryVehicleTimeSensorEntity(TeslemetryVehicleEntity, SensorEntity):
 
     entity_description: TeslemetryTimeEntityDescription
     _last_value: int | None = None
+    streaming_decoder = staticmethod(decode_float)
 
     def __init__(
         self,
@@ -1153,7 +1236,7 @@ class TeslemetryVehicleTimeSensorEntity(TeslemetryVehicleEntity, SensorEntity):
 
     def _async_update_attrs(self) -> None:
         """Update the attributes of the sensor."""
-        if not self.coordinator.updated_once:
+        if not self.coordinator.has_data:
             return None
         self._attr_available = self._value is not None and self._value > 0
 
@@ -1168,13 +1251,16 @@ class TeslemetryVehicleTimeSensorEntity(TeslemetryVehicleEntity, SensorEntity):
 
     def _async_value_from_stream(self, value) -> None:
         self._attr_available = True
-        self._attr_native_value = self._get_timestamp(int(value))
+        self._attr_native_value = self._get_timestamp(value)
 
 
 class TeslemetryStreamSensorEntity(TeslemetryVehicleStreamEntity, SensorEntity):
     """Base class for Teslemetry vehicle streaming sensors."""
 
     entity_description: TeslemetryStreamSensorEntityDescription
+    _filters: tuple[TeslemetryFilter, ...] = ()
+    _overrides: dict[str, float] | None = None
+    _max_rate: float = 0
 
     def __init__(
         self,
@@ -1184,11 +1270,61 @@ class TeslemetryStreamSensorEntity(TeslemetryVehicleStreamEntity, SensorEntity):
         """Initialize the sensor."""
         self.entity_description = description
         super().__init__(data, description.key)
+        self._async_configure_filters(data.stream_filters.get(description.key))
+
+    @callback
+    def _async_configure_filters(self, overrides: dict[str, float] | None) -> None:
+        """Build the filters from the field defaults and the vehicle overrides."""
+        description = self.entity_description
+        # A max rate of 0 leaves only the write interval of the vehicle
+        settings = {
+            CONF_DEADBAND: 0,
+            CONF_DEADBAND_PERCENT: 0,
+            CONF_MAX_RATE: 0,
+            **STREAM_FILTER_DEFAULTS.get(self.streaming_key, {}),
+            **(overrides or {}),
+        }
+        filters = copy_filters(description.filters)
+        if settings[CONF_DEADBAND] or settings[CONF_DEADBAND_PERCENT]:
+            filters += (
+                Deadband(
+                    absolute=settings[CONF_DEADBAND],
+                    percent=settings[CONF_DEADBAND_PERCENT],
+                ),
+            )
+        self._filters = filters
+        self._max_rate = settings[CONF_MAX_RATE]
+        self._overrides = overrides
+
+    @property
+    def _write_interval(self) -> float:
+        """Return the minimum interval between state writes."""
+        if self._max_rate:
+            return max(self.vehicle.write_interval, 1 / self._max_rate)
+        return self.vehicle.write_interval
+
+    @property
+    def streaming_decoder(self) -> Callable[[Any], Any]:
+        """Return the decoder of the streaming key."""
+        return self.entity_description.streaming_decoder
+
+    def _handle_stream_update(self, data: dict[str, Any]) -> None:
+        """Handle updated data from the stream, skipping unchanged states."""
+        previous = (self._attr_available, self._attr_native_value)
+        self._async_value_from_stream(data["data"][self.streaming_key])
+        if (self._attr_available, self._attr_native_value) != previous:
+            self.async_write_coalesced()
 
     def _async_value_from_stream(self, value) -> None:
         """Update the value of the entity."""
+        # Options replace the overrides of the vehicle without a reload
+        overrides = self.vehicle.stream_filters.get(self.streaming_key)
+        if overrides is not self._overrides:
+            self._async_configure_filters(overrides)
         self._attr_available = self.stream.connected
-        self._attr_native_value = self.entity_description.value_fn(value)
+        self._attr_native_value = apply_filters(
+            self._filters, self.entity_description.value_fn(value)
+        )
 
 
 class TeslemetryEnergyLiveSensorEntity(TeslemetryEnergyLiveEntity, SensorEntity):
@@ -1298,7 +1434,7 @@ class TeslemetryEnergyInfoSensorEntity(TeslemetryEnergyInfoEntity, SensorEntity)
         self._attr_available = not self.exactly(None)
         self._attr_native_value = self._value
 
-class TeslemetryVehicleEventEntity(SensorEntity):
+class TeslemetryVehicleEventEntity(TeslemetryVehicleContext, SensorEntity):
     """Parent class for Teslemetry Vehicle Stream entities."""
 
     _attr_has_entity_name = True
@@ -1308,24 +1444,19 @@ class TeslemetryVehicleEventEntity(SensorEntity):
     ) -> None:
         """Initialize common aspects of a Teslemetry entity."""
 
+        self.vehicle = data
         self.key = key
         self._attr_translation_key = f"event_{key}"
-        self.stream = data.stream
-        self.vin = data.vin
-
         self._attr_unique_id = f"{data.vin}-event_{key}"
-        self._attr_device_info = data.device
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        if self.stream.server:
-            self.async_on_remove(
-                self.stream.async_add_listener(
-                    self._handle_stream_update,
-                    {"vin": self.vin, self.key: None},
-                )
+        self.async_on_remove(
+            self.dispatcher.async_add_event_listener(
+                self.key, self._handle_stream_update
             )
+        )
 
     def _handle_stream_update(self, data: dict[str, list]) -> None:
         """Handle updated data from the stream."""
@@ -23,9 +23,8 @@ from homeassistant.helpers import (
 )
 
 
-from .const import DOMAIN
+from .const import DOMAIN, TeslemetryPriority
 from .models import TeslemetryVehicleData, TeslemetryEnergyData
-from .helpers import wake_up_vehicle, handle_vehicle_command
 
 _LOGGER = logging.getLogger(__name__)
 ID = "id"
@@ -97,8 +96,7 @@ def async_register_services(hass: HomeAssistant) -> bool:
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
         try:
-            await wake_up_vehicle(vehicle)
-            await handle_vehicle_command(
+            await vehicle.commands.async_send(
                 vehicle.api.navigation_gps_request(
                     lat=call.data[GPS][CONF_LATITUDE],
                     lon=call.data[GPS][CONF_LONGITUDE],
@@ -131,8 +129,7 @@ def async_register_services(hass: HomeAssistant) -> bool:
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
         try:
-            await wake_up_vehicle(vehicle)
-            await handle_vehicle_command(
+            await vehicle.commands.async_send(
                 vehicle.api.navigation_sc_request(
                     id=call.data.get(ID),
                     order=call.data.get(ORDER),
@@ -161,8 +158,7 @@ def async_register_services(hass: HomeAssistant) -> bool:
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
         try:
-            await wake_up_vehicle(vehicle)
-            await handle_vehicle_command(
+            await vehicle.commands.async_send(
                 vehicle.api.navigation_request(
                     type=call.data.get(TYPE),
                     value=call.data.get(VALUE),
@@ -204,8 +200,7 @@ def async_register_services(hass: HomeAssistant) -> bool:
             time = None
 
         try:
-            await wake_up_vehicle(vehicle)
-            await handle_vehicle_command(vehicle.api.set_scheduled_charging(enable=call.data["enable"], time=time))
+            await vehicle.commands.async_send(vehicle.api.set_scheduled_charging(enable=call.data["enable"], time=time))
         except TeslaFleetError as e:
             raise HomeAssistantError from e
 
@@ -254,8 +249,7 @@ def async_register_services(hass: HomeAssistant) -> bool:
             end_off_peak_time = 0
 
         try:
-            await wake_up_vehicle(vehicle)
-            await handle_vehicle_command(vehicle.api.set_scheduled_departure(
+            await vehicle.commands.async_send(vehicle.api.set_scheduled_departure(
                 enable,
                 preconditioning_enabled,
                 preconditioning_weekdays_only,
@@ -318,8 +312,7 @@ def async_register_services(hass: HomeAssistant) -> bool:
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
         try:
-            await wake_up_vehicle(vehicle)
-            await handle_vehicle_command(vehicle.api.set_valet_mode(
+            await vehicle.commands.async_send(vehicle.api.set_valet_mode(
                 call.data.get("enable"),
                 call.data.get("pin","")
             ))
@@ -347,14 +340,13 @@ def async_register_services(hass: HomeAssistant) -> bool:
         vehicle = async_get_vehicle_for_entry(hass, device, config)
 
         try:
-            await wake_up_vehicle(vehicle)
             enable = call.data.get("enable")
             if (enable is True):
-                await handle_vehicle_command(vehicle.api.speed_limit_activate(
+                await vehicle.commands.async_send(vehicle.api.speed_limit_activate(
                     call.data.get("pin")
                 ))
             elif (enable is False):
-                await handle_vehicle_command(vehicle.api.speed_limit_deactivate(
+                await vehicle.commands.async_send(vehicle.api.speed_limit_deactivate(
                     call.data.get("pin")
                 ))
 
@@ -381,13 +373,16 @@ def async_register_services(hass: HomeAssistant) -> bool:
         site = async_get_energy_site_for_entry(hass, device, config)
 
         try:
-            resp = await site.api.set_time_of_use(
-                call.data.get(TOU_SETTINGS)
+            resp = await site.live_coordinator.scheduler.async_call(
+                TeslemetryPriority.COMMAND,
+                site.api.set_time_of_use(call.data.get(TOU_SETTINGS)),
             )
         except Exception as e:
             raise HomeAssistantError from e
         if "error" in resp:
             raise ServiceValidationError(resp["error"])
+        # Time of use settings are part of the slowly polled site info
+        hass.async_create_task(site.info_coordinator.async_request_refresh())
 
     hass.services.async_register(
         DOMAIN,
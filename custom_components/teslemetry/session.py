@@ -0,0 +1,83 @@
+"""Teslemetry HTTP session."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util import ssl as ssl_util
+
+# Each vehicle stream holds a connection open to its stream server, so the
+# limit leaves room for those alongside a burst of REST calls
+CONNECTIONS_PER_HOST = 20
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+
+
+@callback
+def async_create_session(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+) -> aiohttp.ClientSession:
+    """Create a session with its own connection pool for a config entry.
+
+    The session is closed when the entry unloads, fails to set up, or
+    Home Assistant stops.
+    """
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+            ssl=ssl_util.get_default_context(),
+        ),
+        headers={aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE},
+        trace_configs=trace_configs,
+    )
+
+    async def async_close_session(event: Event) -> None:
+        """Close the session when Home Assistant stops."""
+        await session.close()
+
+    entry.async_on_unload(session.close)
+    # Entries are not unloaded at shutdown, so close the pool explicitly
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_session)
+    )
+    return session
+
+
+def session_stats(session: aiohttp.ClientSession) -> dict[str, Any]:
+    """Return the connection pool statistics of a session."""
+    connector = session.connector
+    if connector is None or session.closed:
+        return {"closed": True}
+    # aiohttp has no public accessors for the pool contents
+    acquired: dict[Any, set[Any]] = getattr(connector, "_acquired_per_host", {})
+    idle: dict[Any, list[Any]] = getattr(connector, "_conns", {})
+    hosts = {key.host for key in (*acquired, *idle)}
+    return {
+        "closed": False,
+        "limit": connector.limit,
+        "limit_per_host": connector.limit_per_host,
+        "acquired": sum(len(conns) for conns in acquired.values()),
+        "idle": sum(len(conns) for conns in idle.values()),
+        "hosts": {
+            host: {
+                "acquired": sum(
+                    len(conns) for key, conns in acquired.items() if key.host == host
+                ),
+                "idle": sum(
+                    len(conns) for key, conns in idle.items() if key.host == host
+                ),
+            }
+            for host in sorted(hosts)
+        },
+    }
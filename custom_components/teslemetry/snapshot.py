@@ -0,0 +1,97 @@
+"""Teslemetry snapshot of the last known data."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from time import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:
+    from .models import TeslemetryEnergyData, TeslemetryVehicleData
+
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 300
+SNAPSHOT_MAX_AGE = timedelta(days=7)
+
+
+class TeslemetrySnapshot:
+    """Persist the last known data of a config entry to hydrate it at startup."""
+
+    saved_at: int | None = None
+    _save_scheduled = False
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}", private=True
+        )
+        self._data: dict[str, Any] = {}
+        self.vehicles: list[TeslemetryVehicleData] = []
+        self.energysites: list[TeslemetryEnergyData] = []
+
+    async def async_load(self) -> None:
+        """Load the snapshot, ignoring it when it is too old to be useful."""
+        data = await self._store.async_load() or {}
+        saved_at = data.get("saved_at")
+        if saved_at is None:
+            return
+        age = timedelta(milliseconds=time() * 1000 - saved_at)
+        if age > SNAPSHOT_MAX_AGE:
+            LOGGER.debug("Ignoring snapshot from %s ago", age)
+            return
+        self.saved_at = saved_at
+        self._data = data
+
+    def vehicle(self, vin: str) -> dict[str, Any] | None:
+        """Return the snapshot of a vehicle."""
+        return self._data.get("vehicles", {}).get(vin)
+
+    def energysite(self, site_id: int) -> dict[str, Any] | None:
+        """Return the snapshot of an energy site."""
+        return self._data.get("energysites", {}).get(str(site_id))
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the snapshot after a delay, so frequent updates are batched."""
+        # Rescheduling would postpone the save for as long as updates arrive
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._async_data, SNAPSHOT_SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the snapshot now."""
+        await self._store.async_save(self._async_data())
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
+
+    @callback
+    def _async_data(self) -> dict[str, Any]:
+        """Return the current data of every vehicle and energy site."""
+        self._save_scheduled = False
+        return {
+            "saved_at": int(time() * 1000),
+            "vehicles": {
+                vehicle.vin: {
+                    "data": dict(vehicle.coordinator.data),
+                    "stream": vehicle.stream.config,
+                }
+                for vehicle in self.vehicles
+                # Products alone are not worth keeping
+                if vehicle.coordinator.has_data
+            },
+            "energysites": {
+                str(energysite.id): {
+                    "live": energysite.live_coordinator.data,
+                    "info": energysite.info_coordinator.data,
+                }
+                for energysite in self.energysites
+                if energysite.live_coordinator.data is not None
+            },
+        }
@@ -0,0 +1,158 @@
+"""Teslemetry stream dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from time import monotonic
+from typing import Any
+
+from teslemetry_stream import TeslemetryStream
+
+from homeassistant.core import callback
+
+from .const import LOGGER
+
+
+class TeslemetryStreamDispatcher:
+    """Route stream messages for a single vehicle to listeners by field.
+
+    Each field is decoded once per message for each distinct decoder of its
+    listeners. Listeners receive a copy of the message with their decoded
+    values, so the payload the library shares with other listeners is never
+    changed.
+    """
+
+    last_received: float | None = None
+
+    def __init__(self, stream: TeslemetryStream, vin: str) -> None:
+        """Initialize the dispatcher."""
+        self.stream = stream
+        self.vin = vin
+        self._fields: dict[
+            str,
+            dict[Callable[[Any], Any] | None, list[Callable[[dict[str, Any]], None]]],
+        ] = {}
+        self._events: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
+        self._remove_listener: Callable[[], None] | None = None
+        self._waiters: list[asyncio.Future[None]] = []
+
+    @callback
+    def async_add_listener(
+        self,
+        field: str,
+        listener: Callable[[dict[str, Any]], None],
+        decoder: Callable[[Any], Any] | None = None,
+    ) -> Callable[[], None]:
+        """Listen for a telemetry field in the data of a stream message."""
+        # Lists are replaced rather than mutated so dispatch can iterate safely
+        decoders = self._fields.setdefault(field, {})
+        decoders[decoder] = [*decoders.get(decoder, ()), listener]
+        self.async_subscribe()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener of the field."""
+            decoders = self._fields.get(field, {})
+            if listeners := [
+                x for x in decoders.get(decoder, ()) if x is not listener
+            ]:
+                decoders[decoder] = listeners
+            else:
+                decoders.pop(decoder, None)
+                if not decoders:
+                    self._fields.pop(field, None)
+            if not self._fields and not self._events:
+                self.async_unsubscribe()
+
+        return remove_listener
+
+    @callback
+    def async_add_event_listener(
+        self, key: str, listener: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], None]:
+        """Listen for a top level key of a stream message, such as alerts."""
+        # Lists are replaced rather than mutated so dispatch can iterate safely
+        self._events[key] = [*self._events.get(key, ()), listener]
+        self.async_subscribe()
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the event listener."""
+            if listeners := [x for x in self._events.get(key, ()) if x is not listener]:
+                self._events[key] = listeners
+            else:
+                self._events.pop(key, None)
+            if not self._fields and not self._events:
+                self.async_unsubscribe()
+
+        return remove_listener
+
+    @callback
+    def async_next_message(self) -> asyncio.Future[None]:
+        """Return a future that is resolved by the next message with data."""
+        self._waiters = [waiter for waiter in self._waiters if not waiter.done()]
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        return waiter
+
+    def received_within(self, seconds: float) -> bool:
+        """Return if the stream delivered a message within the last seconds."""
+        return (
+            self.last_received is not None
+            and monotonic() - self.last_received < seconds
+        )
+
+    @callback
+    def async_subscribe(self) -> None:
+        """Register the single stream listener for this vehicle."""
+        if self._remove_listener is None and self.stream.server:
+            self._remove_listener = self.stream.async_add_listener(
+                self._async_handle_message, {"vin": self.vin}
+            )
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Remove the stream listener for this vehicle."""
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+    @callback
+    def _async_handle_message(self, message: dict[str, Any]) -> None:
+        """Route a stream message to the listeners of each field it contains."""
+        self.last_received = monotonic()
+        if data := message.get("data"):
+            # Alerts and errors can be sent while asleep, data means awake
+            if self._waiters:
+                for waiter in self._waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+                self._waiters = []
+            fields = self._fields
+            # A copy of the message for each decoder, holding its decoded values
+            messages: dict[Callable[[Any], Any] | None, dict[str, Any]] = {
+                None: message
+            }
+            for field, value in data.items():
+                if not (decoders := fields.get(field)):
+                    continue
+                for decoder, listeners in tuple(decoders.items()):
+                    if decoder is not None:
+                        try:
+                            decoded = decoder(value)
+                        except (AttributeError, TypeError, ValueError):
+                            LOGGER.debug("Ignoring invalid %s value %s", field, value)
+                            continue
+                        if (decoded_message := messages.get(decoder)) is None:
+                            decoded_message = messages[decoder] = {
+                                **message,
+                                "data": dict(data),
+                            }
+                        decoded_message["data"][field] = decoded
+                    for listener in listeners:
+                        listener(messages[decoder])
+        for key, listeners in tuple(self._events.items()):
+            if key in message:
+                for listener in listeners:
+                    listener(message)
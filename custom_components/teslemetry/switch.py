@@ -21,8 +21,8 @@ from .const import DOMAIN, TeslemetryTimestamp
 from .entity import (
     TeslemetryVehicleEntity,
     TeslemetryEnergyInfoEntity,
-    TeslemetryEnergyLiveEntity,
 )
+from .helpers import decode_bool
 from .models import (
     TeslemetryVehicleData,
     TeslemetryEnergyData,
@@ -156,6 +156,8 @@ class TeslemetrySwitchEntity(SwitchEntity):
 class TeslemetryVehicleSwitchEntity(TeslemetryVehicleEntity, TeslemetrySwitchEntity):
     """Base class for Teslemetry vehicle switch entities."""
 
+    streaming_decoder = staticmethod(decode_bool)
+
     def __init__(
         self,
         data: TeslemetryVehicleData,
@@ -180,16 +182,18 @@ class TeslemetryVehicleSwitchEntity(TeslemetryVehicleEntity, TeslemetrySwitchEnt
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the Switch."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.entity_description.on_func(self.api))
+        await self.handle_command(
+            self.entity_description.on_func(self.api), self._attr_is_on, True
+        )
         self._attr_is_on = True
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the Switch."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
-        await self.handle_command(self.entity_description.off_func(self.api))
+        await self.handle_command(
+            self.entity_description.off_func(self.api), self._attr_is_on, False
+        )
         self._attr_is_on = False
         self.async_write_ha_state()
 
@@ -197,6 +201,8 @@ class TeslemetryVehicleSwitchEntity(TeslemetryVehicleEntity, TeslemetrySwitchEnt
 class TeslemetryChargeSwitchEntity(TeslemetryVehicleSwitchEntity):
     """Entity class for Teslemetry Charge Switch."""
 
+    coordinator_keys = ("charge_state_charge_enable_request",)
+
     def _async_update_attrs(self) -> None:
         """Update the attributes of the entity."""
         if self._value is None:
@@ -208,7 +214,7 @@ class TeslemetryChargeSwitchEntity(TeslemetryVehicleSwitchEntity):
 
 
 class TeslemetryStormModeSwitchEntity(
-    TeslemetryEnergyLiveEntity, TeslemetrySwitchEntity
+    TeslemetryEnergyInfoEntity, TeslemetrySwitchEntity
 ):
     """Entity class for Storm Watch switch."""
 
@@ -228,16 +234,14 @@ class TeslemetryStormModeSwitchEntity(
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the Switch."""
         self.raise_for_scope()
-        await self.handle_command(self.api.storm_mode(enabled=True))
-        self._attr_is_on = True
-        self.async_write_ha_state()
+        await self.handle_command(self.api.storm_mode(enabled=True), {self.key: True})
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the Switch."""
         self.raise_for_scope()
-        await self.handle_command(self.api.storm_mode(enabled=False))
-        self._attr_is_on = False
-        self.async_write_ha_state()
+        await self.handle_command(
+            self.api.storm_mode(enabled=False), {self.key: False}
+        )
 
 
 class TeslemetryChargeFromGridSwitchEntity(
@@ -268,10 +272,9 @@ class TeslemetryChargeFromGridSwitchEntity(
         await self.handle_command(
             self.api.grid_import_export(
                 disallow_charge_from_grid_with_solar_installed=False
-            )
+            ),
+            {self.key: False},
         )
-        self._attr_is_on = True
-        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the Switch."""
@@ -279,7 +282,6 @@ class TeslemetryChargeFromGridSwitchEntity(
         await self.handle_command(
             self.api.grid_import_export(
                 disallow_charge_from_grid_with_solar_installed=True
-            )
+            ),
+            {self.key: True},
         )
-        self._attr_is_on = False
-        self.async_write_ha_state()
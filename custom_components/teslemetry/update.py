@@ -31,6 +31,12 @@ async def async_setup_entry(
 class TeslemetryUpdateEntity(TeslemetryVehicleEntity, UpdateEntity):
     """Teslemetry Updates entity."""
 
+    coordinator_keys = (
+        "vehicle_state_car_version",
+        "vehicle_state_software_update_version",
+        "vehicle_state_software_update_install_perc",
+    )
+
     _attr_supported_features = UpdateEntityFeature.PROGRESS
 
     def __init__(
@@ -101,7 +107,6 @@ class TeslemetryUpdateEntity(TeslemetryVehicleEntity, UpdateEntity):
     ) -> None:
         """Install an update."""
         self.raise_for_scope()
-        await self.wake_up_if_asleep()
         await self.handle_command(self.api.schedule_software_update(offset_sec=60))
         self._attr_state = TeslemetryUpdateStatus.INSTALLING
         self.async_write_ha_state()
@@ -0,0 +1,57 @@
+"""Tests for the Teslemetry coordinator data structures."""
+
+from tesla_fleet_api.const import TelemetryField, VehicleDataEndpoint
+
+from custom_components.teslemetry.coordinator import (
+    TeslemetryFlattener,
+    TeslemetryValueStore,
+)
+
+PREVIOUS = {
+    "charge_state": {"battery_level": 80, "charge_port_latch": "Engaged"},
+    "climate_state": {"inside_temp": 21},
+}
+
+
+def test_flatten_partial_response_drops_section_keys() -> None:
+    """Test keys missing from a polled section are removed."""
+    flattener = TeslemetryFlattener()
+    previous, _ = flattener.flatten(PREVIOUS, {})
+
+    data, changed = flattener.flatten(
+        {"charge_state": {"battery_level": 79}},
+        previous,
+        [VehicleDataEndpoint.CHARGE_STATE],
+    )
+
+    assert data == {"charge_state_battery_level": 79, "climate_state_inside_temp": 21}
+    assert changed == {"charge_state_battery_level", "charge_state_charge_port_latch"}
+
+
+def test_merge_partial_response_clears_section_slots() -> None:
+    """Test slots missing from a polled section are cleared, others are kept."""
+    store = TeslemetryValueStore()
+    store.merge(PREVIOUS)
+
+    changed = store.merge(
+        {"charge_state": {"battery_level": 79}}, [VehicleDataEndpoint.CHARGE_STATE]
+    )
+
+    assert dict(store) == {
+        "charge_state_battery_level": 79,
+        "climate_state_inside_temp": 21,
+    }
+    assert changed == {"charge_state_battery_level", "charge_state_charge_port_latch"}
+
+
+def test_slot_of_enum_key_is_slot_of_value() -> None:
+    """Test enum keys share the slot of their value without growing the index."""
+    slot = TeslemetryValueStore.slot(TelemetryField.VEHICLE_SPEED)
+    keys = len(TeslemetryValueStore._keys)
+
+    assert TeslemetryValueStore.slot(TelemetryField.VEHICLE_SPEED) == slot
+    assert TeslemetryValueStore.slot(TelemetryField.VEHICLE_SPEED.value) == slot
+    assert TeslemetryValueStore.slot(VehicleDataEndpoint.CHARGE_STATE) == (
+        TeslemetryValueStore.slot("charge_state")
+    )
+    assert len(TeslemetryValueStore._keys) == keys + 1
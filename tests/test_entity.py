@@ -0,0 +1,77 @@
+"""Tests for the Teslemetry entity base classes."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.teslemetry.const import TeslemetryUpdateType
+from custom_components.teslemetry.coordinator import TeslemetryVehicleDataCoordinator
+from custom_components.teslemetry.entity import TeslemetryVehicleEntity
+
+KEY = "vehicle_state_sentry_mode"
+
+
+class FakeCommandQueue:
+    """Command queue that sends every command without a vehicle."""
+
+    async def async_send(
+        self, command: Any, key: str, current: Any, target: Any
+    ) -> tuple[bool, Any]:
+        """Return that the command was sent."""
+        return True, {"response": {"result": True}}
+
+
+class SentryEntity(TeslemetryVehicleEntity):
+    """Vehicle entity holding a single polled value."""
+
+    # Names are translated by the platform, which this test does not set up
+    _attr_has_entity_name = False
+    _attr_name = "Sentry mode"
+
+    def _async_update_attrs(self) -> None:
+        """Update the value from the coordinator."""
+        self._attr_is_on = self._value
+
+    @property
+    def state(self) -> str:
+        """Return the value as the state."""
+        return "on" if self._attr_is_on else "off"
+
+
+@pytest.mark.asyncio
+async def test_unconfirmed_command_reverts_after_streaming_gap(tmp_path) -> None:
+    """Test a commanded value is released when the vehicle never confirms it."""
+    hass = HomeAssistant(str(tmp_path))
+    dispatcher = SimpleNamespace(received_within=lambda seconds: False)
+    coordinator = TeslemetryVehicleDataCoordinator(
+        hass,
+        SimpleNamespace(pre2021=False),
+        {"vin": "LRW3F7EK4NC000000", KEY: False},
+        dispatcher,
+        None,
+    )
+    coordinator.streaming_gap = 50
+    vehicle = SimpleNamespace(
+        vin="LRW3F7EK4NC000000",
+        coordinator=coordinator,
+        commands=FakeCommandQueue(),
+        write_interval=0,
+    )
+    entity = SentryEntity(vehicle, KEY)
+    entity.hass = hass
+    entity.entity_id = "switch.sentry_mode"
+
+    await entity.handle_command(None, False, True)
+    entity._attr_is_on = True
+    entity.async_write_ha_state()
+    assert hass.states.get("switch.sentry_mode").state == "on"
+
+    await asyncio.sleep(0.1)
+
+    assert entity._updated_by == TeslemetryUpdateType.POLLING
+    assert hass.states.get("switch.sentry_mode").state == "off"
+    await hass.async_stop(force=True)